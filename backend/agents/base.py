@@ -5,22 +5,87 @@ Provides abstract foundation for all specialized agents in the content creation
 All agents inherit from this class and implement the execute() method.
 """
 
+import asyncio
+import hashlib
+import json
 import time
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 
-from openai import AsyncOpenAI
+import httpx
+from cachetools import TTLCache
+from openai import APIConnectionError, APITimeoutError, AsyncOpenAI, RateLimitError
 
 from backend.config import get_settings
 from utils.logger import get_logger
+from utils.rate_limiter import AsyncRateLimiter
 
 settings = get_settings()
 logger = get_logger(__name__)
 
+# Process-wide OpenAI client shared by all agents. A per-agent client would
+# own its own httpx connection pool and TLS session, so the six workflow
+# agents would each pay handshake cost instead of reusing warm connections.
+_SHARED_CLIENT: Optional[AsyncOpenAI] = None
+
+
+def _get_shared_client() -> AsyncOpenAI:
+    """
+    Get (lazily creating) the shared AsyncOpenAI client.
+
+    Returns:
+        AsyncOpenAI: Singleton client with a pooled HTTP transport
+    """
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None:
+        _SHARED_CLIENT = AsyncOpenAI(
+            api_key=settings.openai_api_key,
+            max_retries=2,
+            timeout=60.0,
+            http_client=httpx.AsyncClient(
+                timeout=60.0,
+                limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            ),
+        )
+    return _SHARED_CLIENT
+
+# In-process response cache for deterministic LLM calls.
+# Maps request hash -> response text. Retries and re-runs of a workflow on
+# the same topic re-send identical prompts, so a hit skips the entire OpenAI
+# round-trip (and its token cost). TTLCache evicts expired and least-recent
+# entries itself, so multi-KB responses don't accumulate for the process
+# lifetime.
+_LLM_CACHE_TTL = 3600  # seconds
+_LLM_CACHE: TTLCache = TTLCache(maxsize=256, ttl=_LLM_CACHE_TTL)
+_LLM_CACHE_MAX_TEMPERATURE = 0.4  # don't cache creative (high-temp) calls
+
+# Single-flight table: maps request hash -> Future for the call currently in
+# flight. Concurrent identical requests (A/B variants, overlapping topics)
+# await the first caller's result instead of issuing duplicate API calls.
+_LLM_INFLIGHT: Dict[str, "asyncio.Future[str]"] = {}
+
+# Bound on concurrent LLM requests across all agents. Lets fan-out (run_many)
+# keep multiple requests in flight without overwhelming the provider's QPS.
+_LLM_SEM = asyncio.Semaphore(settings.llm_concurrency)
+
+# Bound on request *rate* across all agents - the semaphore caps how many are
+# in flight, the bucket caps how fast new ones start. Staying under the
+# provider quota avoids 429s and their retry/backoff churn.
+_LLM_LIMITER = AsyncRateLimiter(settings.openai_requests_per_minute)
+
+# Retry policy for transient provider errors (429 bursts, timeouts, dropped
+# connections). Validation errors and unknown exceptions are never retried.
+_MAX_TRANSIENT_RETRIES = 2
+_RETRY_BACKOFF_SECONDS = 1.0  # doubled on each attempt
+
 
 class AgentResponse:
     """Standardized response format for all agents."""
 
+    # One instance per agent call; __slots__ drops the per-instance __dict__
+    # and makes attribute access a fixed-offset load
+    __slots__ = ("status", "data", "message", "error", "execution_time")
+
     def __init__(
         self,
         status: str,
@@ -74,9 +139,15 @@ class BaseAgent(ABC):
         self.name = name
         self.logger = get_logger(f"agent.{name}")
         self.settings = settings
-        
-        # Initialize OpenAI client
-        self.llm_client = AsyncOpenAI(api_key=settings.openai_api_key)
+
+        # Snapshot hot LLM settings as plain locals; _call_llm reads these on
+        # every request and the flat attributes skip the Settings lookup chain
+        self._model = settings.llm_model
+        self._temperature = settings.llm_temperature
+        self._max_tokens = settings.max_tokens
+
+        # All agents share one OpenAI client (and thus one connection pool)
+        self.llm_client = _get_shared_client()
 
     @abstractmethod
     async def execute(self, input_data: Dict[str, Any]) -> AgentResponse:
@@ -96,7 +167,7 @@ class BaseAgent(ABC):
         """
         raise NotImplementedError(f"{self.name} must implement execute()")
 
-    async def run(self, input_data: Dict[str, Any]) -> AgentResponse:
+    async def run(self, input_data: Dict[str, Any], validated: bool = False) -> AgentResponse:
         """
         Execute agent with error handling and timing.
 
@@ -104,38 +175,94 @@ class BaseAgent(ABC):
 
         Args:
             input_data: Input data dictionary
+            validated: Skip input validation; set by callers (the workflow)
+                that already validated the fields once at entry
 
         Returns:
             AgentResponse: Execution result
         """
-        start_time = time.time()
-        self.logger.info(f"[{self.name}] Starting execution...")
+        # Monotonic nanosecond clock: cheaper than time.time() and immune to
+        # wall-clock adjustments mid-run, which would poison execution_time
+        start_ns = time.perf_counter_ns()
+        self.logger.info("[%s] Starting execution...", self.name)
+
+        if not validated:
+            try:
+                # Validate input (never retried - bad input stays bad)
+                self._validate_input(input_data)
+            except ValueError as e:
+                return self._error_response(e, start_ns)
+
+        for attempt in range(_MAX_TRANSIENT_RETRIES + 1):
+            try:
+                # Execute agent logic
+                response = await self.execute(input_data)
+
+                # Add execution time
+                response.execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+
+                self.logger.info(
+                    "[%s] Completed successfully in %.2fs", self.name, response.execution_time
+                )
+                return response
+
+            except (RateLimitError, APITimeoutError, APIConnectionError) as e:
+                # Transient provider errors: back off and retry before giving
+                # up. str(e) is deferred to _error_response so the retry hot
+                # path never pays for APIError message reconstruction.
+                if attempt < _MAX_TRANSIENT_RETRIES:
+                    delay = _RETRY_BACKOFF_SECONDS * (2 ** attempt)
+                    self.logger.warning(
+                        "[%s] Transient API error (%s), retrying in %.1fs",
+                        self.name, type(e).__name__, delay,
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+                return self._error_response(e, start_ns)
+
+            except ValueError as e:
+                # Validation/parsing failure inside execute - retrying won't help
+                return self._error_response(e, start_ns)
+
+            except Exception as e:
+                # Unknown failure - report and bail
+                return self._error_response(e, start_ns)
+
+    def _error_response(self, error: Exception, start_ns: int) -> AgentResponse:
+        """
+        Build a standardized error response for a failed run.
 
-        try:
-            # Validate input
-            self._validate_input(input_data)
+        Args:
+            error: The exception that aborted execution
+            start_ns: time.perf_counter_ns() captured at run() entry
 
-            # Execute agent logic
-            response = await self.execute(input_data)
-            
-            # Add execution time
-            response.execution_time = time.time() - start_time
+        Returns:
+            AgentResponse: Error response with timing
+        """
+        execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+        self.logger.error("[%s] Failed after %.2fs: %s", self.name, execution_time, error)
+
+        return AgentResponse(
+            status="error",
+            message=f"{self.name} execution failed",
+            error=str(error),
+            execution_time=execution_time,
+        )
 
-            self.logger.info(
-                f"[{self.name}] Completed successfully in {response.execution_time:.2f}s"
-            )
-            return response
+    async def run_many(self, inputs: list) -> list:
+        """
+        Execute the agent concurrently over multiple inputs.
 
-        except Exception as e:
-            execution_time = time.time() - start_time
-            self.logger.error(f"[{self.name}] Failed after {execution_time:.2f}s: {str(e)}")
-            
-            return AgentResponse(
-                status="error",
-                message=f"{self.name} execution failed",
-                error=str(e),
-                execution_time=execution_time,
-            )
+        Requests run in parallel, bounded by the shared LLM semaphore, so
+        fan-out scales with provider QPS rather than serial latency.
+
+        Args:
+            inputs: List of input data dictionaries
+
+        Returns:
+            list[AgentResponse]: One response per input, in order
+        """
+        return await asyncio.gather(*(self.run(input_data) for input_data in inputs))
 
     def _validate_input(self, input_data: Dict[str, Any]) -> None:
         """
@@ -158,6 +285,8 @@ class BaseAgent(ABC):
         system_prompt: Optional[str] = None,
         temperature: Optional[float] = None,
         max_tokens: Optional[int] = None,
+        stream: bool = False,
+        response_format: Optional[Dict[str, str]] = None,
     ) -> str:
         """
         Call OpenAI LLM with standardized settings.
@@ -167,40 +296,191 @@ class BaseAgent(ABC):
             system_prompt: System prompt (optional)
             temperature: Temperature override (optional)
             max_tokens: Max tokens override (optional)
+            stream: Consume the response as a token stream (optional). The
+                full text is still returned, but tokens arrive incrementally,
+                which surfaces time-to-first-token and allows cancellation
+                mid-response instead of waiting out the entire generation.
+            response_format: OpenAI response_format payload, e.g.
+                {"type": "json_object"} to guarantee parseable JSON (optional)
+
+        Returns:
+            str: LLM response text
+        """
+        effective_temperature = temperature or self._temperature
+        effective_max_tokens = max_tokens or self._max_tokens
+
+        # Creative (high-temp) calls go straight to the API
+        if effective_temperature > _LLM_CACHE_MAX_TEMPERATURE:
+            return await self._request_completion(
+                prompt, system_prompt, effective_temperature, effective_max_tokens,
+                stream=stream, response_format=response_format,
+            )
+
+        # Low-temperature (repeatable) calls: check the response cache first
+        cache_key = self._llm_cache_key(
+            prompt, system_prompt, effective_temperature, effective_max_tokens,
+            response_format,
+        )
+        cached = _LLM_CACHE.get(cache_key)
+        if cached is not None:
+            self.logger.debug("[%s] LLM cache hit, skipping API call", self.name)
+            return cached
+
+        # Single-flight: if an identical request is already in flight, wait
+        # for its result instead of issuing a duplicate network call
+        inflight = _LLM_INFLIGHT.get(cache_key)
+        if inflight is not None:
+            self.logger.debug("[%s] Coalescing onto in-flight LLM request", self.name)
+            return await inflight
+
+        future: "asyncio.Future[str]" = asyncio.get_running_loop().create_future()
+        _LLM_INFLIGHT[cache_key] = future
+        try:
+            result = await self._request_completion(
+                prompt, system_prompt, effective_temperature, effective_max_tokens,
+                stream=stream, response_format=response_format,
+            )
+            _LLM_CACHE[cache_key] = result
+            future.set_result(result)
+            return result
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved; waiters still see the raise
+            raise
+        finally:
+            # Cancellation is a BaseException and skips the handler above;
+            # an unresolved future here would strand every coalesced waiter,
+            # so cancel it too before dropping the in-flight entry
+            if not future.done():
+                future.cancel()
+            _LLM_INFLIGHT.pop(cache_key, None)
+
+    async def _request_completion(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        stream: bool = False,
+        response_format: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """
+        Issue the actual chat-completion request.
+
+        Args:
+            prompt: User prompt
+            system_prompt: System prompt (optional)
+            temperature: Effective temperature
+            max_tokens: Effective max tokens
+            stream: Consume the response incrementally (optional)
+            response_format: OpenAI response_format payload (optional)
 
         Returns:
             str: LLM response text
         """
         messages = []
-        
+
         if system_prompt:
             messages.append({"role": "system", "content": system_prompt})
-        
-        messages.append({"role": "user", "content": prompt})
-
-        self.logger.debug(f"[{self.name}] Calling LLM with {len(prompt)} char prompt")
 
-        response = await self.llm_client.chat.completions.create(
-            model=self.settings.llm_model,
-            messages=messages,
-            temperature=temperature or self.settings.llm_temperature,
-            max_tokens=max_tokens or self.settings.max_tokens,
-        )
+        messages.append({"role": "user", "content": prompt})
 
-        result = response.choices[0].message.content
-        self.logger.debug(f"[{self.name}] LLM returned {len(result)} characters")
+        extra_kwargs = {"response_format": response_format} if response_format else {}
+
+        self.logger.debug("[%s] Calling LLM with %d char prompt", self.name, len(prompt))
+
+        async with _LLM_SEM:
+            await _LLM_LIMITER.acquire()
+            if stream:
+                request_start = time.time()
+                response_stream = await self.llm_client.chat.completions.create(
+                    model=self._model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    stream=True,
+                    **extra_kwargs,
+                )
+                parts = []
+                first_chunk = True
+                async for chunk in response_stream:
+                    if first_chunk:
+                        self.logger.debug(
+                            "[%s] First token after %.2fs", self.name,
+                            time.time() - request_start,
+                        )
+                        first_chunk = False
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        parts.append(chunk.choices[0].delta.content)
+                result = "".join(parts)
+            else:
+                response = await self.llm_client.chat.completions.create(
+                    model=self._model,
+                    messages=messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **extra_kwargs,
+                )
+                result = response.choices[0].message.content
+
+        self.logger.debug("[%s] LLM returned %d characters", self.name, len(result))
 
         return result
 
-    def log_info(self, message: str) -> None:
-        """Log info message with agent name."""
-        self.logger.info(f"[{self.name}] {message}")
+    def _llm_cache_key(
+        self,
+        prompt: str,
+        system_prompt: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[Dict[str, str]] = None,
+    ) -> str:
+        """
+        Build a stable cache key for an LLM request.
 
-    def log_debug(self, message: str) -> None:
-        """Log debug message with agent name."""
-        self.logger.debug(f"[{self.name}] {message}")
+        Args:
+            prompt: User prompt
+            system_prompt: System prompt (optional)
+            temperature: Effective temperature
+            max_tokens: Effective max tokens
+            response_format: OpenAI response_format payload (optional)
 
-    def log_error(self, message: str) -> None:
-        """Log error message with agent name."""
-        self.logger.error(f"[{self.name}] {message}")
+        Returns:
+            str: SHA-256 hex digest of the request parameters
+        """
+        payload = json.dumps(
+            {
+                "m": self._model,
+                "s": system_prompt,
+                "u": prompt,
+                "t": temperature,
+                "mx": max_tokens,
+                "rf": response_format,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def log_info(self, message: str, *args: Any) -> None:
+        """Log info message with agent name (lazy %-style formatting)."""
+        if args:
+            self.logger.info("[%s] " + message, self.name, *args)
+        else:
+            # No args: the message is data, not a template - a literal '%'
+            # in it (user-supplied topics) must not reach the formatter
+            self.logger.info("[%s] %s", self.name, message)
+
+    def log_debug(self, message: str, *args: Any) -> None:
+        """Log debug message with agent name (lazy %-style formatting)."""
+        if args:
+            self.logger.debug("[%s] " + message, self.name, *args)
+        else:
+            self.logger.debug("[%s] %s", self.name, message)
+
+    def log_error(self, message: str, *args: Any) -> None:
+        """Log error message with agent name (lazy %-style formatting)."""
+        if args:
+            self.logger.error("[%s] " + message, self.name, *args)
+        else:
+            self.logger.error("[%s] %s", self.name, message)
 
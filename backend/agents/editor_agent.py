@@ -5,10 +5,60 @@ Reviews and improves article content quality.
 Fourth agent in the content creation pipeline.
 """
 
+import re
+from string import Template
 from typing import Dict, Any
 
+from openai import APIConnectionError, APITimeoutError, RateLimitError
+
 from backend.agents.base import BaseAgent, AgentResponse
 
+# Precompiled token pattern for word counting without materializing the
+# full token list the way str.split() does
+_WORD_RE = re.compile(r"\S+")
+
+
+def _word_count(text: str) -> int:
+    """Count whitespace-delimited words without allocating a token list."""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+# Frozen system prompt prefix. Keeping this byte-identical across calls lets
+# the provider reuse its server-side prompt cache for the shared prefix; the
+# per-request tone/audience values are appended as a small dynamic suffix.
+_EDITOR_SYSTEM_PROMPT = """You are an expert editor reviewing and improving article content.
+
+Editing Checklist:
+1. Grammar & Spelling: Fix all errors
+2. Flow & Coherence: Improve transitions, logical flow
+3. Clarity: Simplify complex sentences, remove jargon (unless appropriate for the target audience)
+4. Tone: Ensure the requested tone is consistent throughout
+5. Accuracy: Verify claims align with research context
+6. Engagement: Strengthen opening and closing
+7. Structure: Ensure proper heading hierarchy
+8. Readability: Vary sentence length, use active voice
+
+What to KEEP:
+- The core message and key points
+- Technical accuracy
+- Markdown formatting
+- Overall structure
+
+What to IMPROVE:
+- Awkward phrasing
+- Redundancy
+- Weak transitions
+- Passive voice
+- Unclear statements
+
+Output ONLY the edited article content, no meta-commentary."""
+
+# Pre-parsed template: Template splits the literal chunks once at import, so
+# each call only fills the two small variable slots instead of rebuilding the
+# whole prompt string.
+_EDITOR_SYSTEM_TMPL = Template(
+    _EDITOR_SYSTEM_PROMPT + "\n\nTone: $tone\nAudience: $target_audience"
+)
+
 
 class EditorAgent(BaseAgent):
     """
@@ -56,8 +106,8 @@ class EditorAgent(BaseAgent):
         tone = input_data.get("tone", "professional")
         target_audience = input_data.get("target_audience", "general")
 
-        self.log_info(f"Editing article for topic: '{topic}'")
-        self.log_debug(f"Content length: {len(content)} characters")
+        self.log_info("Editing article for topic: '%s'", topic)
+        self.log_debug("Content length: %d characters", len(content))
 
         try:
             # Perform comprehensive editing
@@ -72,7 +122,7 @@ class EditorAgent(BaseAgent):
             # Analyze improvements made
             improvements = self._analyze_changes(content, edited_content)
 
-            self.log_info(f"Editing complete. {improvements['summary']}")
+            self.log_info("Editing complete. %s", improvements["summary"])
 
             return AgentResponse(
                 status="success",
@@ -85,8 +135,10 @@ class EditorAgent(BaseAgent):
                 message=f"Content edited successfully. {improvements['summary']}",
             )
 
+        except (RateLimitError, APITimeoutError, APIConnectionError):
+            raise  # retried with backoff in run()
         except Exception as e:
-            self.log_error(f"Editing failed: {str(e)}")
+            self.log_error("Editing failed: %s", e)
             return AgentResponse(
                 status="error",
                 error=str(e),
@@ -114,48 +166,34 @@ class EditorAgent(BaseAgent):
         Returns:
             str: Edited and improved content
         """
-        system_prompt = f"""You are an expert editor reviewing and improving article content.
-
-Editing Checklist:
-1. Grammar & Spelling: Fix all errors
-2. Flow & Coherence: Improve transitions, logical flow
-3. Clarity: Simplify complex sentences, remove jargon (unless appropriate for {target_audience})
-4. Tone: Ensure consistent {tone} tone throughout
-5. Accuracy: Verify claims align with research context
-6. Engagement: Strengthen opening and closing
-7. Structure: Ensure proper heading hierarchy
-8. Readability: Vary sentence length, use active voice
-
-What to KEEP:
-- The core message and key points
-- Technical accuracy
-- Markdown formatting
-- Overall structure
+        # Slice the research context up front so only the preview is kept alive
+        synthesis_preview = (research_synthesis or "")[:500] or "No research context available"
 
-What to IMPROVE:
-- Awkward phrasing
-- Redundancy
-- Weak transitions
-- Passive voice
-- Unclear statements
-
-Output ONLY the edited article content, no meta-commentary."""
+        # Static prefix + small dynamic suffix (keeps the prefix cacheable)
+        system_prompt = _EDITOR_SYSTEM_TMPL.substitute(
+            tone=tone, target_audience=target_audience
+        )
 
         user_prompt = f"""Edit and improve the following article about "{topic}".
 
 Research Context (for fact-checking):
-{research_synthesis[:500] if research_synthesis else 'No research context available'}
+{synthesis_preview}
 
 Article to Edit:
 {content}
 
 Provide the edited version with improvements to grammar, flow, clarity, and engagement."""
 
+        # Drop local references to the large inputs while the network call is
+        # outstanding so the caller's buffers aren't pinned for the duration
+        del content, research_synthesis
+
         edited = await self._call_llm(
             prompt=user_prompt,
             system_prompt=system_prompt,
             temperature=0.3,  # Lower temp for precise editing
             max_tokens=3500,
+            stream=True,  # Long generation: stream tokens as they arrive
         )
 
         return edited.strip()
@@ -171,11 +209,12 @@ Provide the edited version with improvements to grammar, flow, clarity, and enga
         Returns:
             Dict with change analysis
         """
-        original_words = len(original.split())
-        edited_words = len(edited.split())
+        # Count once per string without the ~word-count-sized list that
+        # str.split() would allocate and immediately discard
+        original_words = _word_count(original)
+        edited_words = _word_count(edited)
         word_diff = edited_words - original_words
 
-        original_paras = original.count("\n\n")
         edited_paras = edited.count("\n\n")
 
         # Simple change detection
@@ -5,10 +5,39 @@ Generates cover images using DALL-E.
 Sixth and final agent in the content creation pipeline.
 """
 
-from typing import Dict, Any
+import asyncio
+from functools import lru_cache
+from typing import Dict, Any, List
 
 from backend.agents.base import BaseAgent, AgentResponse
 
+# Bound on concurrent DALL-E requests. Image generation is slow and
+# rate-limited more aggressively than chat completions, so bulk runs keep
+# several submissions in flight without tripping provider limits.
+_IMAGE_SEM = asyncio.Semaphore(6)
+
+
+@lru_cache(maxsize=256)
+def _simple_prompt(topic: str) -> str:
+    """
+    Build the fallback image prompt for a topic.
+
+    Pure function of the topic, so repeat topics (retries, batch runs on
+    near-duplicate inputs) reuse the memoized string.
+
+    Args:
+        topic: Article topic
+
+    Returns:
+        str: Basic image prompt
+    """
+    # Adjacent literals merge at compile time: one constant + one concat
+    return (
+        f"A professional, modern illustration representing {topic}. "
+        "High quality, clean design, suitable for article cover art. "
+        "Vibrant colors, abstract or minimalist style."
+    )
+
 
 class ImageAgent(BaseAgent):
     """
@@ -55,18 +84,18 @@ class ImageAgent(BaseAgent):
         # Get content for context (prefer edited version)
         content = input_data.get("edited_content") or input_data.get("content", "")
 
-        self.log_info(f"Generating cover image for topic: '{topic}'")
+        self.log_info("Generating cover image for topic: '%s'", topic)
 
         try:
             # Generate DALL-E prompt from content
             image_prompt = await self._create_image_prompt(topic, content)
 
-            self.log_debug(f"Image prompt: {image_prompt[:100]}...")
+            self.log_debug("Image prompt: %.100s...", image_prompt)
 
             # Generate image using DALL-E
             image_url = await self._generate_image(image_prompt)
 
-            self.log_info(f"Image generated successfully: {image_url[:50]}...")
+            self.log_info("Image generated successfully: %.50s...", image_url)
 
             return AgentResponse(
                 status="success",
@@ -79,7 +108,7 @@ class ImageAgent(BaseAgent):
             )
 
         except Exception as e:
-            self.log_error(f"Image generation failed: {str(e)}")
+            self.log_error("Image generation failed: %s", e)
             # Image generation is non-critical, return success with null URL
             return AgentResponse(
                 status="success",  # Still success, just no image
@@ -104,8 +133,10 @@ class ImageAgent(BaseAgent):
         """
         # If we have content, use it for context; otherwise use topic only
         if content and len(content) > 100:
-            # Use LLM to extract visual concepts from content
+            # Use LLM to extract visual concepts from content. Slice first and
+            # drop the full article so it isn't pinned in memory during the await.
             content_preview = content[:1000]  # First 1000 chars
+            del content
 
             system_prompt = """You are an expert at creating image prompts for DALL-E.
 
@@ -155,14 +186,9 @@ Generate a detailed image prompt that would create a compelling cover image for
             topic: Article topic
 
         Returns:
-            str: Basic image prompt
+            str: Basic image prompt (memoized per topic)
         """
-        # Simple prompt construction
-        prompt = f"A professional, modern illustration representing {topic}. "
-        prompt += "High quality, clean design, suitable for article cover art. "
-        prompt += "Vibrant colors, abstract or minimalist style."
-
-        return prompt
+        return _simple_prompt(topic)
 
     async def _generate_image(self, prompt: str) -> str:
         """
@@ -174,22 +200,39 @@ Generate a detailed image prompt that would create a compelling cover image for
         Returns:
             str: URL of generated image
         """
-        self.log_debug(f"Calling DALL-E with model: {self.settings.image_model}")
-
-        # Call OpenAI Images API
-        response = await self.llm_client.images.generate(
-            model=self.settings.image_model,
-            prompt=prompt,
-            size=self.settings.image_size,
-            quality="standard",  # or "hd" for higher quality (more expensive)
-            n=1,  # Number of images to generate
-        )
+        self.log_debug("Calling DALL-E with model: %s", self.settings.image_model)
+
+        # Call OpenAI Images API (bounded so bulk runs overlap without bursts)
+        async with _IMAGE_SEM:
+            response = await self.llm_client.images.generate(
+                model=self.settings.image_model,
+                prompt=prompt,
+                size=self.settings.image_size,
+                quality="standard",  # or "hd" for higher quality (more expensive)
+                n=1,  # Number of images to generate
+            )
 
         # Extract image URL from response
         image_url = response.data[0].url
 
         return image_url
 
+    async def execute_many(self, inputs: List[Dict[str, Any]]) -> List[AgentResponse]:
+        """
+        Generate cover images for multiple articles concurrently.
+
+        All DALL-E submissions go through one async path bounded by the
+        image semaphore, so bulk generation overlaps the slow HTTP calls
+        instead of issuing them one at a time.
+
+        Args:
+            inputs: List of input data dictionaries (same shape as execute)
+
+        Returns:
+            List[AgentResponse]: One response per input, in order
+        """
+        return await self.run_many(inputs)
+
     def _validate_input(self, input_data: Dict[str, Any]) -> None:
         """Validate required input fields."""
         super()._validate_input(input_data)
@@ -5,10 +5,84 @@ Creates structured content outlines from research data.
 Second agent in the content creation pipeline.
 """
 
-from typing import Dict, Any
+from string import Template
+from typing import Dict, Any, Tuple
+
+from openai import APIConnectionError, APITimeoutError, RateLimitError
 
 from backend.agents.base import BaseAgent, AgentResponse
 
+try:  # Numba is optional; without it the C-backed str.count fallback is used
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _count_markers_jit(data: bytes) -> Tuple[int, int]:
+        """Fused single-pass count of '##' section headers and '-' sub-points."""
+        n_sections = 0
+        n_subpoints = 0
+        i = 0
+        n = len(data)
+        while i < n:
+            c = data[i]
+            if c == 45:  # '-'
+                n_subpoints += 1
+            elif c == 35 and i + 1 < n and data[i + 1] == 35:  # '##'
+                # Skip the second '#' to match str.count's non-overlapping semantics
+                n_sections += 1
+                i += 1
+            i += 1
+        return n_sections, n_subpoints
+
+
+def _count_markers(outline: str) -> Tuple[int, int]:
+    """
+    Count outline structure markers ('##' sections, '-' sub-points).
+
+    Uses the Numba-jitted single-pass scan when available (compiled once,
+    persisted via cache=True); otherwise falls back to two str.count scans.
+
+    Args:
+        outline: Generated outline text
+
+    Returns:
+        Tuple of (num_sections, num_subpoints)
+    """
+    if njit is not None:
+        return _count_markers_jit(outline.encode())
+    return outline.count("##"), outline.count("-")
+
+# Frozen system prompt prefix. Keeping this byte-identical across calls lets
+# the provider reuse its server-side prompt cache for the shared prefix; the
+# per-request depth/tone/audience values are appended as a dynamic suffix.
+_OUTLINE_SYSTEM_PROMPT = """You are an expert content strategist creating article outlines.
+
+Your outline should:
+1. Match the requested depth
+2. Use hierarchical structure (## for main sections, - for sub-points)
+3. Be tailored for the target audience
+4. Match the requested tone
+5. Flow logically from introduction to conclusion
+6. Be specific and actionable (not vague headings)
+
+Format:
+## Section Title
+- Key point 1
+- Key point 2
+
+Do NOT include meta-commentary. Output only the outline."""
+
+# Pre-parsed template: Template splits the literal chunks once at import, so
+# each call only fills the small variable slots instead of rebuilding the
+# whole prompt string.
+_OUTLINE_SYSTEM_TMPL = Template(
+    _OUTLINE_SYSTEM_PROMPT + "\n\nDepth: $depth\nTone: $tone\nAudience: $target_audience"
+)
+
 
 class OutlineAgent(BaseAgent):
     """
@@ -52,8 +126,8 @@ class OutlineAgent(BaseAgent):
         target_audience = input_data.get("target_audience", "general")
         min_words = input_data.get("min_words", 800)
 
-        self.log_info(f"Creating outline for topic: '{topic}'")
-        self.log_debug(f"Parameters: tone={tone}, audience={target_audience}, target_words={min_words}")
+        self.log_info("Creating outline for topic: '%s'", topic)
+        self.log_debug("Parameters: tone=%s, audience=%s, target_words=%s", tone, target_audience, min_words)
 
         try:
             # Extract research synthesis and key findings
@@ -72,8 +146,11 @@ class OutlineAgent(BaseAgent):
                 min_words=min_words,
             )
 
+            # Count structure markers in one fused pass and reuse the results
+            num_sections, num_subpoints = _count_markers(outline)
+
             # Validate outline structure
-            if not self._validate_outline(outline):
+            if not self._validate_outline(outline, num_sections, num_subpoints):
                 self.log_error("Generated outline failed validation")
                 return AgentResponse(
                     status="error",
@@ -81,20 +158,22 @@ class OutlineAgent(BaseAgent):
                     message="Failed to generate proper outline format",
                 )
 
-            self.log_info(f"Outline created with {outline.count('##')} main sections")
+            self.log_info("Outline created with %d main sections", num_sections)
 
             return AgentResponse(
                 status="success",
                 data={
                     "outline": outline,
-                    "num_sections": outline.count("##"),
-                    "estimated_paragraphs": outline.count("-"),
+                    "num_sections": num_sections,
+                    "estimated_paragraphs": num_subpoints,
                 },
-                message=f"Outline created with {outline.count('##')} sections",
+                message=f"Outline created with {num_sections} sections",
             )
 
+        except (RateLimitError, APITimeoutError, APIConnectionError):
+            raise  # retried with backoff in run()
         except Exception as e:
-            self.log_error(f"Outline generation failed: {str(e)}")
+            self.log_error("Outline generation failed: %s", e)
             return AgentResponse(
                 status="error",
                 error=str(e),
@@ -142,22 +221,10 @@ class OutlineAgent(BaseAgent):
         else:
             depth = "comprehensive, with 5-7 main sections"
 
-        system_prompt = f"""You are an expert content strategist creating article outlines.
-
-Your outline should:
-1. Be {depth}
-2. Use hierarchical structure (## for main sections, - for sub-points)
-3. Be tailored for {target_audience} audience
-4. Match a {tone} tone
-5. Flow logically from introduction to conclusion
-6. Be specific and actionable (not vague headings)
-
-Format:
-## Section Title
-- Key point 1
-- Key point 2
-
-Do NOT include meta-commentary. Output only the outline."""
+        # Static prefix + small dynamic suffix (keeps the prefix cacheable)
+        system_prompt = _OUTLINE_SYSTEM_TMPL.substitute(
+            depth=depth, tone=tone, target_audience=target_audience
+        )
 
         user_prompt = f"""Topic: {topic}
 
@@ -181,12 +248,14 @@ The outline should organize the research findings into a logical flow that will
 
         return outline.strip()
 
-    def _validate_outline(self, outline: str) -> bool:
+    def _validate_outline(self, outline: str, num_sections: int, num_subpoints: int) -> bool:
         """
         Validate that outline has proper structure.
 
         Args:
             outline: Generated outline
+            num_sections: Precomputed count of section headers (##)
+            num_subpoints: Precomputed count of sub-points (-)
 
         Returns:
             bool: True if valid, False otherwise
@@ -196,12 +265,12 @@ The outline should organize the research findings into a logical flow that will
             return False
 
         # Check for section headers (##)
-        if outline.count("##") < 2:
+        if num_sections < 2:
             self.log_debug("Outline has fewer than 2 main sections")
             return False
 
         # Check for sub-points (-)
-        if outline.count("-") < 3:
+        if num_subpoints < 3:
             self.log_debug("Outline has fewer than 3 sub-points")
             return False
 
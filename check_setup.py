@@ -5,12 +5,21 @@ Checks that all dependencies are installed and configurations are correct.
 Run this before starting development or testing.
 """
 
+import importlib
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple
 
 
 def check_imports() -> List[Tuple[str, bool, str]]:
-    """Check if all required packages can be imported."""
+    """
+    Check if all required packages can be imported.
+
+    Imports run on a thread pool: the expensive part of a cold import is
+    file I/O (stat calls, reading .pyc/source), which releases the GIL, so
+    independent top-level packages load concurrently and the check
+    finishes in a fraction of the sequential wall time.
+    """
     packages = [
         ("langgraph", "LangGraph workflow engine"),
         ("langchain", "LangChain framework"),
@@ -28,15 +37,27 @@ def check_imports() -> List[Tuple[str, bool, str]]:
         ("beautifulsoup4", "HTML parsing"),
     ]
 
-    results = []
-    for package, description in packages:
+    def check_one(package: str, description: str) -> Tuple[str, bool, str]:
         try:
-            __import__(package)
-            results.append((package, True, description))
+            module = importlib.import_module(package)
+            # pydantic must be v2: the Rust pydantic-core validator is
+            # what keeps request/response validation cheap
+            if package == "pydantic" and not module.VERSION.startswith("2."):
+                return (
+                    package, False,
+                    f"{description} - ERROR: v2 required, found {module.VERSION}",
+                )
+            return (package, True, description)
         except ImportError as e:
-            results.append((package, False, f"{description} - ERROR: {str(e)}"))
-
-    return results
+            return (package, False, f"{description} - ERROR: {str(e)}")
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(check_one, package, description)
+            for package, description in packages
+        ]
+        # Collect in submission order so the report stays stable
+        return [future.result() for future in futures]
 
 
 def check_env_file() -> Tuple[bool, str]:
@@ -5,17 +5,19 @@ Interactive UI for multi-agent AI content creation system.
 Connects to FastAPI backend for article generation with real-time progress.
 """
 
+import asyncio
 import os
-import json
 import time
 import threading
+from collections import deque
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 from pathlib import Path
 
+import orjson
 import streamlit as st
 import requests
-from websocket import WebSocketApp
+import websockets
 import markdown
 from fpdf import FPDF, XPos, YPos
 
@@ -59,15 +61,32 @@ if "ws_messages" not in st.session_state:
 if "generation_complete" not in st.session_state:
     st.session_state.generation_complete = False
 
+if "last_ws_ts" not in st.session_state:
+    st.session_state.last_ws_ts = 0.0
+
 
 # ============================================================================
 # API Functions
 # ============================================================================
 
+# One pooled session for every backend call: keep-alive reuses the TCP
+# connection across the status-polling loop instead of opening a fresh
+# socket per request
+SESSION = requests.Session()
+SESSION.mount(
+    "http://",
+    requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8),
+)
+SESSION.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8),
+)
+
+
 def check_backend_health() -> bool:
     """Check if backend is accessible."""
     try:
-        response = requests.get(f"{BACKEND_URL}/health", timeout=5)
+        response = SESSION.get(f"{BACKEND_URL}/health", timeout=5)
         return response.status_code == 200
     except:
         return False
@@ -88,7 +107,7 @@ def create_article(
         Dict with article data or None if error
     """
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{BACKEND_URL}/articles/create",
             json={
                 "topic": topic,
@@ -110,7 +129,7 @@ def create_article(
 def get_article_status(article_id: int) -> Optional[Dict[str, Any]]:
     """Get article generation status."""
     try:
-        response = requests.get(
+        response = SESSION.get(
             f"{BACKEND_URL}/articles/{article_id}/status",
             timeout=5
         )
@@ -123,7 +142,7 @@ def get_article_status(article_id: int) -> Optional[Dict[str, Any]]:
 def get_article_result(article_id: int) -> Optional[Dict[str, Any]]:
     """Get completed article content."""
     try:
-        response = requests.get(
+        response = SESSION.get(
             f"{BACKEND_URL}/articles/{article_id}/result",
             timeout=10
         )
@@ -137,12 +156,12 @@ def get_article_result(article_id: int) -> Optional[Dict[str, Any]]:
 def list_articles(limit: int = 10) -> List[Dict[str, Any]]:
     """List recent articles."""
     try:
-        response = requests.get(
+        response = SESSION.get(
             f"{BACKEND_URL}/articles/?limit={limit}",
             timeout=5
         )
         response.raise_for_status()
-        return response.json()
+        return response.json()["items"]
     except:
         return []
 
@@ -150,7 +169,7 @@ def list_articles(limit: int = 10) -> List[Dict[str, Any]]:
 def delete_article(article_id: int) -> bool:
     """Delete article."""
     try:
-        response = requests.delete(
+        response = SESSION.delete(
             f"{BACKEND_URL}/articles/{article_id}",
             timeout=5
         )
@@ -165,55 +184,76 @@ def delete_article(article_id: int) -> bool:
 
 def start_websocket(article_id: int):
     """
-    Start WebSocket connection for real-time updates.
-    Runs in separate thread.
+    Consume WebSocket progress updates for an article.
+
+    Runs in a separate thread, but drives the connection with the
+    asyncio-native websockets client: frames are awaited rather than
+    blocking in a recv() syscall per message, so the thread sleeps on the
+    event loop between updates.
     """
     ws_url = f"{WS_BACKEND_URL}/ws/articles/{article_id}"
-    
-    def on_message(ws, message):
-        try:
-            data = json.loads(message)
+
+    # Coalescing buffer: bursts of updates (terminal replay, parallel
+    # agents finishing together) land here and hit session_state as one
+    # batch per 150ms window instead of one rerun-triggering write each
+    pending = deque()
+
+    def flush():
+        batch = []
+        while pending:
+            batch.append(pending.popleft())
+
+        if batch:
+            # Freshness marker: while this keeps advancing, the main loop
+            # trusts the WS stream and skips HTTP status polling
+            st.session_state.last_ws_ts = time.monotonic()
+
+        for data in batch:
             st.session_state.ws_messages.append(data)
-            
+
             # Update progress based on message type
             if data.get("type") == "agent_update":
                 agent_name = data.get("agent")
                 if agent_name and agent_name not in [log.get("agent") for log in st.session_state.agent_logs]:
                     st.session_state.agent_logs.append(data)
-            
+
             elif data.get("type") == "final":
                 st.session_state.generation_complete = True
-                
-        except Exception as e:
-            pass
-    
-    def on_error(ws, error):
-        pass
-    
-    def on_close(ws, close_status_code, close_msg):
-        pass
-    
-    def on_open(ws):
-        pass
-    
+
+    async def consumer():
+        async with websockets.connect(ws_url) as ws:
+            async for message in ws:
+                try:
+                    # orjson parses both str and bytes frames, several
+                    # times faster than stdlib json
+                    pending.append(orjson.loads(message))
+                    # First message of a burst schedules one flush for
+                    # the window
+                    if len(pending) == 1:
+                        threading.Timer(0.15, flush).start()
+
+                except Exception:
+                    pass
+
     try:
-        ws = WebSocketApp(
-            ws_url,
-            on_message=on_message,
-            on_error=on_error,
-            on_close=on_close,
-            on_open=on_open
-        )
-        ws.run_forever()
-    except Exception as e:
+        asyncio.run(consumer())
+    except Exception:
         # WebSocket failed, will fall back to polling
         pass
+    finally:
+        # Drain anything still buffered when the stream ends
+        flush()
 
 
 # ============================================================================
 # Export Functions
 # ============================================================================
 
+# Built once: markdown.markdown() re-parses the extension configs on every
+# call; a shared converter just needs reset() between documents
+MD = markdown.Markdown(extensions=['extra', 'codehilite'], output_format='html5')
+
+
 def export_as_markdown(content: str, title: str) -> str:
     """Export content as markdown."""
     return f"# {title}\n\n{content}"
@@ -221,7 +261,7 @@ def export_as_markdown(content: str, title: str) -> str:
 
 def export_as_html(content: str, title: str, seo_meta: Optional[Dict] = None) -> str:
     """Export content as HTML."""
-    html_content = markdown.markdown(content, extensions=['extra', 'codehilite'])
+    html_content = MD.reset().convert(content)
     
     html = f"""<!DOCTYPE html>
 <html lang="en">
@@ -254,11 +294,15 @@ def export_as_pdf(content: str, title: str) -> bytes:
     pdf.ln(10)
     
     pdf.set_font("Helvetica", "", 12)
-    # Simple text export (markdown not rendered in PDF)
-    for line in content.split('\n'):
-        if line.strip():
-            pdf.multi_cell(0, 6, line)
-    
+    # Simple text export (markdown not rendered in PDF). One multi_cell
+    # per paragraph, not per line - each call runs fpdf's line-breaking
+    # layout, so batching whole paragraphs cuts the call count ~10-20x
+    for para in content.replace('\r', '').split('\n\n'):
+        para = para.strip()
+        if para:
+            pdf.multi_cell(0, 6, para)
+            pdf.ln(3)
+
     return pdf.output(dest='S').encode('latin-1')
 
 
@@ -296,6 +340,25 @@ def render_agent_timeline(agent_logs: List[Dict], current_status: str):
                 st.write(f"○ {agent.replace('Agent', '')}")
 
 
+def _word_count(content: str) -> int:
+    """
+    Word count for the content tabs, cached across reruns.
+
+    str.split() allocates a list with one entry per word, and Streamlit
+    re-runs the whole script on every interaction - so count once per
+    distinct content and remember it in session state.
+    """
+    cache = st.session_state.setdefault("_wc_cache", {})
+    key = hash(content)
+    count = cache.get(key)
+    if count is None:
+        # Only one article is on screen at a time - no need to keep
+        # counts for content we're no longer showing
+        cache.clear()
+        count = cache[key] = len(content.split())
+    return count
+
+
 def render_content_tabs(result: Dict[str, Any]):
     """Render content in tabs."""
     tabs = st.tabs(["📝 Outline", "✍️ Draft", "✨ Edited", "🔍 SEO", "🖼️ Image"])
@@ -312,10 +375,8 @@ def render_content_tabs(result: Dict[str, Any]):
         if result.get("content"):
             # Show raw content before editing
             st.markdown(result["content"])
-            
-            # Word count
-            word_count = len(result["content"].split())
-            st.caption(f"📊 Word count: {word_count}")
+
+            st.caption(f"📊 Word count: {_word_count(result['content'])}")
         else:
             st.info("Draft not available yet")
     
@@ -323,10 +384,8 @@ def render_content_tabs(result: Dict[str, Any]):
     with tabs[2]:
         if result.get("content"):
             st.markdown(result["content"])
-            
-            # Word count
-            word_count = len(result["content"].split())
-            st.caption(f"📊 Word count: {word_count}")
+
+            st.caption(f"📊 Word count: {_word_count(result['content'])}")
         else:
             st.info("Edited content not available yet")
     
@@ -539,9 +598,22 @@ def main():
     if st.session_state.current_article_id:
         article_id = st.session_state.current_article_id
         
-        # Get current status
-        status_data = get_article_status(article_id)
-        
+        # Get current status - from the WebSocket stream while it's
+        # delivering (a WS frame costs a few bytes vs ~1KB of HTTP headers
+        # per poll); fall back to HTTP only when the stream has gone quiet
+        status_data = None
+        if time.monotonic() - st.session_state.last_ws_ts < 10:
+            for msg in reversed(st.session_state.ws_messages):
+                if msg.get("type") in ("status", "status_change", "final"):
+                    status_data = {
+                        "status": msg.get("status") or msg.get("new_status"),
+                        "message": msg.get("message", ""),
+                    }
+                    break
+
+        if status_data is None:
+            status_data = get_article_status(article_id)
+
         if status_data:
             current_status = status_data["status"]
             
@@ -561,7 +633,7 @@ def main():
                 
                 # Get article to check for agent_logs
                 try:
-                    article_data = requests.get(f"{BACKEND_URL}/articles/{article_id}").json()
+                    article_data = SESSION.get(f"{BACKEND_URL}/articles/{article_id}").json()
                     if article_data.get("agent_logs"):
                         render_agent_timeline(article_data["agent_logs"], current_status)
                 except:
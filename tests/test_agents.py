@@ -56,6 +56,79 @@ async def test_base_agent_validation():
     assert result.status == "error"
 
 
+@pytest.mark.asyncio
+async def test_llm_response_cache():
+    """Test that identical low-temperature LLM calls hit the response cache."""
+    from backend.agents import base
+
+    base._LLM_CACHE.clear()
+    agent = MockAgent(name="TestAgent")
+
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message=MagicMock(content="cached answer"))]
+
+    with patch.object(
+        agent.llm_client.chat.completions, 'create', new_callable=AsyncMock
+    ) as mock_create:
+        mock_create.return_value = mock_response
+
+        first = await agent._call_llm("same prompt", temperature=0.3)
+        second = await agent._call_llm("same prompt", temperature=0.3)
+
+    assert first == second == "cached answer"
+    assert mock_create.call_count == 1  # Second call served from cache
+
+
+@pytest.mark.asyncio
+async def test_llm_inflight_coalescing():
+    """Test that concurrent identical LLM calls share a single API request."""
+    import asyncio
+    from backend.agents import base
+
+    base._LLM_CACHE.clear()
+    agent = MockAgent(name="TestAgent")
+
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message=MagicMock(content="shared answer"))]
+
+    async def slow_create(*args, **kwargs):
+        await asyncio.sleep(0.05)
+        return mock_response
+
+    with patch.object(
+        agent.llm_client.chat.completions, 'create', side_effect=slow_create
+    ) as mock_create:
+        first, second = await asyncio.gather(
+            agent._call_llm("same prompt", temperature=0.3),
+            agent._call_llm("same prompt", temperature=0.3),
+        )
+
+    assert first == second == "shared answer"
+    assert mock_create.call_count == 1  # Second caller joined the in-flight request
+
+
+@pytest.mark.asyncio
+async def test_llm_cache_skips_high_temperature():
+    """Test that high-temperature (creative) calls bypass the cache."""
+    from backend.agents import base
+
+    base._LLM_CACHE.clear()
+    agent = MockAgent(name="TestAgent")
+
+    mock_response = MagicMock()
+    mock_response.choices = [MagicMock(message=MagicMock(content="creative answer"))]
+
+    with patch.object(
+        agent.llm_client.chat.completions, 'create', new_callable=AsyncMock
+    ) as mock_create:
+        mock_create.return_value = mock_response
+
+        await agent._call_llm("same prompt", temperature=0.7)
+        await agent._call_llm("same prompt", temperature=0.7)
+
+    assert mock_create.call_count == 2  # No caching at high temperature
+
+
 # ============================================================================
 # Test ResearchAgent
 # ============================================================================
@@ -118,14 +118,16 @@ async def test_get_article_status_not_found():
 
 @pytest.mark.asyncio
 async def test_list_articles():
-    """Test listing articles with pagination."""
+    """Test listing articles with keyset pagination."""
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
-        response = await client.get("/articles/?skip=0&limit=10")
-        
+        response = await client.get("/articles/?limit=10")
+
         assert response.status_code == 200
         data = response.json()
-        assert isinstance(data, list)
+        assert isinstance(data["items"], list)
+        assert "next_before_created_at" in data
+        assert "next_before_id" in data
 
 
 # ============================================================================
@@ -190,8 +192,8 @@ async def test_websocket_connection():
     # Note: This is a simplified test. Full testing requires websocket client
     try:
         with client.websocket_connect(f"/ws/articles/{article_id}") as websocket:
-            # Should establish connection
-            data = websocket.receive_json()
+            # Should establish connection (server sends binary orjson frames)
+            data = websocket.receive_json(mode="binary")
             assert "type" in data
     except Exception:
         # WebSocket testing in test environment can be tricky
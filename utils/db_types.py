@@ -0,0 +1,28 @@
+"""
+Custom SQLAlchemy column types.
+
+ORJSON replaces the stock JSON column type on the workflow-state columns:
+stdlib json encodes/decodes those payloads in pure Python, while orjson does
+it several times faster in C - and the encode runs on every article write.
+"""
+
+import orjson
+from sqlalchemy import Text
+from sqlalchemy.types import TypeDecorator
+
+
+class ORJSON(TypeDecorator):
+    """JSON column backed by orjson instead of the stdlib encoder."""
+
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return orjson.dumps(value).decode()
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return orjson.loads(value)
@@ -0,0 +1,100 @@
+"""
+Disk-backed TTL cache.
+
+Persists expensive call results (e.g. web search responses) across process
+restarts using a small SQLite database. Values are stored as JSON, so
+anything json-serializable can be cached. Built on the stdlib sqlite3
+module - no extra dependency.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DiskCache:
+    """
+    SQLite-backed key/value cache with per-entry expiry.
+
+    A hit is a single indexed SELECT (<10ms), so wrapping a multi-second
+    network call with this converts repeat calls into local reads. The
+    connection is opened lazily on first use and guarded by a lock so the
+    cache is safe to call from worker threads.
+    """
+
+    def __init__(self, path: str, ttl_seconds: float = 86400.0):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Database file path (parent directories are created)
+            ttl_seconds: Entry lifetime; expired entries read as misses
+        """
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Fetch a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The stored value, or None if missing or expired
+        """
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT created, value FROM cache WHERE key = ?", (key,))
+                .fetchone()
+            )
+        if row is None:
+            return None
+        created, value = row
+        if time.time() - created > self.ttl_seconds:
+            return None
+        return json.loads(value)
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value, replacing any existing entry for the key.
+
+        Args:
+            key: Cache key
+            value: Any json-serializable value
+        """
+        payload = json.dumps(value)
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, created, value) VALUES (?, ?, ?)",
+                (key, time.time(), payload),
+            )
+            # Opportunistically drop expired rows so the file stays bounded
+            conn.execute(
+                "DELETE FROM cache WHERE created < ?",
+                (time.time() - self.ttl_seconds,),
+            )
+            conn.commit()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use (caller must hold the lock)."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache "
+                "(key TEXT PRIMARY KEY, created REAL, value TEXT)"
+            )
+            self._conn.commit()
+        return self._conn
@@ -5,22 +5,70 @@ Text processing, validation, and conversion helpers.
 """
 
 import re
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 import markdown
 from bs4 import BeautifulSoup
 
+try:  # numba is optional; the regex fallback needs nothing extra
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Precompiled for the count_words fallback path
+_WORD_COUNT_RE = re.compile(r"\w+")
+
+if njit is not None:
+    import numpy as np
+
+    @njit(cache=True)
+    def _count_words_jit(buf):  # pragma: no cover - requires numba
+        """Count word runs in a UTF-8 byte buffer without allocations.
+
+        A byte is part of a word if it is ASCII alphanumeric, underscore,
+        or the start of a multi-byte character (>= 128) - a close
+        approximation of the \\w class for real-world text.
+        """
+        count = 0
+        in_word = False
+        for b in buf:
+            is_word = (
+                (48 <= b <= 57)
+                or (65 <= b <= 90)
+                or (97 <= b <= 122)
+                or b == 95
+                or b >= 128
+            )
+            if is_word and not in_word:
+                count += 1
+            in_word = is_word
+        return count
+
+
+# Shared by extract_keywords; hoisted so neither is rebuilt per call
+_KEYWORD_RE = re.compile(r"\b[a-z]{4,}\b")
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "is", "was", "are", "were", "been", "be",
+})
+
 
 def count_words(text: str) -> int:
     """
     Count words in a text string.
 
+    Uses an allocation-free jitted byte scan when numba is installed (the
+    regex path materializes a list of every match); falls back to the
+    precompiled regex otherwise.
+
     Args:
         text: Input text
 
     Returns:
         int: Word count
     """
-    return len(re.findall(r"\w+", text))
+    if njit is not None:
+        return _count_words_jit(np.frombuffer(text.encode(), np.uint8))
+    return len(_WORD_COUNT_RE.findall(text))
 
 
 def markdown_to_html(md_text: str) -> str:
@@ -50,28 +98,31 @@ def clean_html(html_text: str) -> str:
     return soup.get_text(strip=True)
 
 
-def extract_keywords(text: str, max_keywords: int = 10) -> List[str]:
+def extract_keywords(
+    text: str,
+    max_keywords: int = 10,
+    tokens: Optional[List[str]] = None,
+) -> List[str]:
     """
     Simple keyword extraction (placeholder for more advanced NLP).
 
     Args:
         text: Input text
         max_keywords: Maximum number of keywords to extract
+        tokens: Pre-tokenized words from text, if the caller already split
+            it; avoids re-scanning the full string
 
     Returns:
         List[str]: Extracted keywords
     """
-    # Remove common stop words (simplified)
-    stop_words = {
-        "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-        "of", "with", "by", "from", "is", "was", "are", "were", "been", "be",
-    }
+    if tokens is not None:
+        words = (w for token in tokens for w in _KEYWORD_RE.findall(token.lower()))
+    else:
+        words = _KEYWORD_RE.findall(text.lower())
 
-    words = re.findall(r"\b[a-z]{4,}\b", text.lower())
     word_freq: Dict[str, int] = {}
-
     for word in words:
-        if word not in stop_words:
+        if word not in _STOP_WORDS:
             word_freq[word] = word_freq.get(word, 0) + 1
 
     # Sort by frequency and return top keywords
@@ -0,0 +1,49 @@
+"""
+Async token-bucket rate limiter.
+
+Bounds the *rate* of outbound API calls (requests per minute), complementing
+semaphores that bound how many are in flight at once. Keeping below provider
+quotas avoids 429 responses and the retry/backoff churn they cause.
+"""
+
+import asyncio
+import time
+
+
+class AsyncRateLimiter:
+    """
+    Token-bucket limiter for outbound API calls.
+
+    Tokens refill continuously at the configured rate up to a burst
+    capacity; each acquire() consumes one token, sleeping until a token is
+    available. Waiters are served in FIFO order.
+    """
+
+    def __init__(self, rate_per_minute: float, burst: int = 10):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate_per_minute: Sustained request rate to allow
+            burst: Bucket capacity - how many requests may fire back-to-back
+        """
+        self._rate = rate_per_minute / 60.0  # tokens per second
+        self._capacity = float(burst)
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Take one token, waiting for a refill if the bucket is empty."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity,
+                    self._tokens + (now - self._updated) * self._rate,
+                )
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self._rate)
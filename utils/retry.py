@@ -0,0 +1,54 @@
+"""
+Exponential-backoff retry helper for async callables.
+
+Used around whole-workflow invocations so a transient provider spike (429
+burst, upstream 5xx) doesn't surface as a user-visible failure that forces a
+full re-run.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, TypeVar
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+async def with_backoff(
+    coro_fn: Callable[[], Awaitable[T]],
+    is_retryable: Callable[[Exception], bool],
+    max_attempts: int = 3,
+    base: float = 2.0,
+    cap: float = 60.0,
+) -> T:
+    """
+    Run an async callable, retrying retryable failures with backoff.
+
+    Sleeps base * 2^attempt seconds between attempts (capped), so three
+    attempts cover roughly a 2s-60s upstream blip. Non-retryable errors and
+    the final attempt's failure propagate unchanged.
+
+    Args:
+        coro_fn: Zero-argument callable returning the awaitable to run
+        is_retryable: Predicate deciding whether an exception warrants retry
+        max_attempts: Total attempts including the first
+        base: Initial sleep in seconds, doubled per retry
+        cap: Upper bound on any single sleep
+
+    Returns:
+        The callable's result
+    """
+    for attempt in range(max_attempts):
+        try:
+            return await coro_fn()
+        except Exception as e:
+            if attempt == max_attempts - 1 or not is_retryable(e):
+                raise
+            delay = min(base * (2 ** attempt), cap)
+            logger.warning(
+                "Retryable failure (attempt %d/%d), backing off %.1fs: %s",
+                attempt + 1, max_attempts, delay, e,
+            )
+            await asyncio.sleep(delay)
@@ -0,0 +1,183 @@
+"""
+Semantic response cache for LLM calls.
+
+Caches responses keyed by prompt meaning rather than exact bytes, so
+near-duplicate requests ("Write about X" vs "Article on X") reuse a prior
+response instead of paying for a fresh LLM round-trip.
+
+Uses fastembed embeddings with cosine-similarity matching when the optional
+dependency is installed; otherwise falls back to normalized-text exact
+matching, which still catches casing/whitespace/punctuation variants.
+"""
+
+import re
+import time
+from typing import List, Optional, Tuple
+
+from utils.logger import get_logger
+
+try:  # fastembed is optional; the normalized-text fallback needs nothing extra
+    from fastembed import TextEmbedding
+except ImportError:
+    TextEmbedding = None
+
+logger = get_logger(__name__)
+
+_NON_WORD_RE = re.compile(r"[^a-z0-9\s]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Lazily loaded embedding model shared by every cache instance and by
+# embed_texts(); loading the ONNX model is the expensive part, so it happens
+# at most once per process. False marks a failed load so we don't retry.
+_SHARED_EMBEDDER = None
+
+
+def _get_embedder():
+    """Return the shared TextEmbedding model, or None if unavailable."""
+    global _SHARED_EMBEDDER
+    if _SHARED_EMBEDDER is None:
+        if TextEmbedding is None:
+            _SHARED_EMBEDDER = False
+        else:
+            try:
+                _SHARED_EMBEDDER = TextEmbedding("BAAI/bge-small-en-v1.5")
+            except Exception as e:  # model download/load failure - degrade gracefully
+                logger.warning("Embedding model unavailable: %s", e)
+                _SHARED_EMBEDDER = False
+    return _SHARED_EMBEDDER or None
+
+
+def embed_texts(texts: List[str]) -> Optional[List]:
+    """
+    Embed a batch of texts in a single model pass.
+
+    One batched call amortizes padding and model overhead across the whole
+    list - far cheaper than embedding each text individually.
+
+    Args:
+        texts: Texts to embed
+
+    Returns:
+        List of embedding vectors in input order, or None if no embedding
+        model is available
+    """
+    embedder = _get_embedder()
+    if embedder is None or not texts:
+        return None
+    return list(embedder.embed(texts))
+
+
+def _normalize(text: str) -> str:
+    """Normalize text for fallback matching (lowercase, strip punctuation)."""
+    return _WHITESPACE_RE.sub(" ", _NON_WORD_RE.sub(" ", text.lower())).strip()
+
+
+class SemanticLLMCache:
+    """
+    In-process semantic cache mapping prompt text to LLM responses.
+
+    Entries expire after a TTL. With fastembed available, lookups embed the
+    prompt and return the stored response whose vector clears the cosine
+    similarity threshold; without it, lookups match on normalized text.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.9,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 256,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            similarity_threshold: Minimum cosine similarity for a hit
+            ttl_seconds: Entry lifetime in seconds
+            max_entries: Bound on stored entries (oldest evicted first)
+        """
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+
+        # Each entry: (timestamp, normalized_key, embedding_or_None, response)
+        self._entries: List[Tuple[float, str, Optional[object], str]] = []
+
+    @property
+    def _embedder(self):
+        """Shared embedding model (loaded lazily, once per process)."""
+        return _get_embedder()
+
+    def lookup(self, prompt: str, embedding=None) -> Optional[str]:
+        """
+        Look up a cached response for a semantically similar prompt.
+
+        Args:
+            prompt: Prompt text to match
+            embedding: Precomputed vector for the prompt; skips re-embedding
+                when the caller already has one
+
+        Returns:
+            Cached response text, or None on miss
+        """
+        self._evict_expired()
+
+        if embedding is not None or self._embedder is not None:
+            return self._lookup_semantic(prompt, embedding)
+
+        normalized = _normalize(prompt)
+        for _, key, _, response in self._entries:
+            if key == normalized:
+                logger.debug("Semantic cache hit (normalized text match)")
+                return response
+        return None
+
+    def store(self, prompt: str, response: str, embedding=None) -> None:
+        """
+        Store a response under the given prompt.
+
+        Args:
+            prompt: Prompt text used as the cache key
+            response: LLM response to cache
+            embedding: Precomputed vector for the prompt; skips re-embedding
+                when the caller already has one
+        """
+        if embedding is None and self._embedder is not None:
+            embedding = self._embed(prompt)
+        self._entries.append((time.time(), _normalize(prompt), embedding, response))
+
+        # Bound memory: drop oldest entries beyond the cap
+        if len(self._entries) > self.max_entries:
+            del self._entries[: len(self._entries) - self.max_entries]
+
+    def _lookup_semantic(self, prompt: str, embedding=None) -> Optional[str]:
+        """Find the best entry by cosine similarity against the prompt embedding."""
+        import numpy as np
+
+        query = embedding if embedding is not None else self._embed(prompt)
+        best_score = 0.0
+        best_response = None
+
+        for _, _, embedding, response in self._entries:
+            if embedding is None:
+                continue
+            score = float(
+                np.dot(query, embedding)
+                / (np.linalg.norm(query) * np.linalg.norm(embedding))
+            )
+            if score > best_score:
+                best_score = score
+                best_response = response
+
+        if best_response is not None and best_score >= self.similarity_threshold:
+            logger.debug("Semantic cache hit (cosine similarity %.3f)", best_score)
+            return best_response
+        return None
+
+    def _embed(self, text: str):
+        """Embed text with the fastembed model."""
+        return next(iter(self._embedder.embed([text])))
+
+    def _evict_expired(self) -> None:
+        """Drop entries older than the TTL."""
+        cutoff = time.time() - self.ttl_seconds
+        self._entries = [entry for entry in self._entries if entry[0] >= cutoff]